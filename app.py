@@ -1,22 +1,26 @@
 import os
+import re
 import json
 import asyncio
 import tempfile
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import fields, is_dataclass
 from datetime import datetime
-from pathlib import Path
+from enum import Enum
 
 import streamlit as st
-import nest_asyncio
 
-# Apply nest_asyncio to allow asyncio.run() within Streamlit's async loop if needed
-nest_asyncio.apply()
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from qa_agent.crawler import crawl_sync
-from qa_agent.config import QAContext, QAReport
+from qa_agent.config import CheckStatus, QAContext, QAReport
 from qa_agent.checks import run_all
-from qa_agent.reporter import to_markdown
-from qa_agent.asana_client import build_context_from_task, post_results, get_qa_tasks
+from qa_agent.reporter import render_markdown
+from qa_agent.asana_client import build_context_from_task, post_results, get_qa_tasks, get_client
 
 # --- 1. SETTINGS & CSS ---
 st.set_page_config(
@@ -43,6 +47,13 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Batch scans are I/O-bound (Playwright + Asana), so a few workers overlap the waits
+BATCH_MAX_WORKERS = 4
+
+# Asana GIDs are massive (15+ digits)
+_ASANA_GID_RE = re.compile(r'\d{10,}')
+
+
 # --- 2. SESSION STATE INIT ---
 def init_session_state():
     for key in ["report", "snapshot", "json_data", "md_content", "batch_results", "asana_comment_gid"]:
@@ -52,28 +63,73 @@ def init_session_state():
 
 # --- 3. HELPER FUNCTIONS ---
 def build_json(report: QAReport) -> dict:
+    # CheckResult dataclasses are serialized directly by dump_json
     return {
         "url": report.context.landing_page_url,
         "timestamp": datetime.now().isoformat(),
         "summary": report.summary,
-        "results": [
-            {
-                "check_id": r.check_id,
-                "name": r.name,
-                "category": r.category,
-                "status": r.status.value,
-                "message": r.message,
-                "evidence": r.evidence,
-            }
-            for r in report.results
-        ],
+        "results": report.results,
     }
 
 
+def _json_default(obj):
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(payload: dict) -> bytes:
+    """Serialize a JSON payload to UTF-8 bytes for the download button."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, default=_json_default).encode("utf-8")
+
+
+STATUS_TABLE_ICONS = {"pass": "✅", "fail": "❌", "warn": "⚠️", "skip": "⏭️"}
+
+
+def _check_detail_markdown(r) -> str:
+    """Check ID, message and evidence as one markdown element for an expander."""
+    body = f"**Check ID:** `{r.check_id}`\n\n{r.message}"
+    if r.evidence:
+        body += f"\n\n```\n{r.evidence[:1000]}\n```"
+    return body
+
+
+def _category_table_rows(cat_results) -> list[dict]:
+    return [
+        {
+            "Status": STATUS_TABLE_ICONS.get(r.status.value, "❓"),
+            "Check ID": r.check_id,
+            "Name": r.name,
+            "Message": r.message,
+        }
+        for r in cat_results
+    ]
+
+
+# Fragment: interacting with one report's widgets reruns only that report,
+# not every report on a batch dashboard.
+@st.fragment
 def _render_results(report: QAReport, snapshot):
     """Renders the QA Report results into the Streamlit UI."""
     s = report.summary
 
+    # Partition results once; every section below reads from these buckets
+    by_status = {status: [] for status in CheckStatus}
+    by_cat = {}
+    for r in report.results:
+        by_status[r.status].append(r)
+        by_cat.setdefault(r.category, []).append(r)
+    failed = by_status[CheckStatus.FAIL]
+    warnings = by_status[CheckStatus.WARN]
+    passed = by_status[CheckStatus.PASS]
+    skipped = by_status[CheckStatus.SKIP]
+
     # SECTION A — Summary Metrics
     cols = st.columns(5)
     cols[0].metric("Total", s["total"])
@@ -83,7 +139,7 @@ def _render_results(report: QAReport, snapshot):
     cols[4].metric("⏭️ Skipped", s["skipped"])
 
     pass_rate_str = s["pass_rate"]
-    pass_rate = float(pass_rate_str.strip('%')) if '%' in pass_rate_str else 0
+    pass_rate = s["pass_rate_pct"]
 
     if pass_rate >= 80:
         st.success(f"✅ Pass rate: {pass_rate_str} — Looking good!")
@@ -110,37 +166,31 @@ def _render_results(report: QAReport, snapshot):
         st.markdown("---")
 
     # SECTION C — Failures
-    if report.failed:
-        st.subheader(f"❌ {len(report.failed)} Failure(s) — Action Required")
-        for r in report.failed:
+    if failed:
+        st.subheader(f"❌ {len(failed)} Failure(s) — Action Required")
+        for r in failed:
             with st.expander(f"❌ {r.name}  ·  {r.category}", expanded=True):
-                st.markdown(f"**Check ID:** `{r.check_id}`")
-                st.markdown(r.message)
-                if r.evidence:
-                    st.code(r.evidence[:1000], language=None)
+                st.markdown(_check_detail_markdown(r))
 
     # SECTION D — Warnings
-    if report.warnings:
-        st.subheader(f"⚠️ {len(report.warnings)} Warning(s) — Review Recommended")
-        for r in report.warnings:
+    if warnings:
+        st.subheader(f"⚠️ {len(warnings)} Warning(s) — Review Recommended")
+        for r in warnings:
             with st.expander(f"⚠️ {r.name}  ·  {r.category}", expanded=False):
-                st.markdown(f"**Check ID:** `{r.check_id}`")
-                st.markdown(r.message)
-                if r.evidence:
-                    st.code(r.evidence[:1000], language=None)
+                st.markdown(_check_detail_markdown(r))
 
     st.markdown("<br>", unsafe_allow_html=True)
 
     # SECTION E — Passed Checks
-    if report.passed:
-        with st.expander(f"✅ {len(report.passed)} Check(s) Passed", expanded=False):
-            for r in report.passed:
+    if passed:
+        with st.expander(f"✅ {len(passed)} Check(s) Passed", expanded=False):
+            for r in passed:
                 st.markdown(f"✅ **{r.name}** ({r.category}) — {r.message[:120]}")
 
     # SECTION F — Skipped Checks
-    if report.skipped:
-        with st.expander(f"⏭️ {len(report.skipped)} Check(s) Skipped (Manual/Future Phase)", expanded=False):
-            for r in report.skipped:
+    if skipped:
+        with st.expander(f"⏭️ {len(skipped)} Check(s) Skipped (Manual/Future Phase)", expanded=False):
+            for r in skipped:
                 st.markdown(f"⏭️ **{r.name}** ({r.category}) — {r.message[:120]}")
 
     st.markdown("<br>", unsafe_allow_html=True)
@@ -153,21 +203,11 @@ def _render_results(report: QAReport, snapshot):
     ])
 
     def render_category_table(category_name):
-        cat_results = [r for r in report.results if r.category == category_name]
+        cat_results = by_cat.get(category_name)
         if not cat_results:
             st.info(f"No checks in {category_name} category.")
             return
-
-        icon_map = {"pass": "✅", "fail": "❌", "warn": "⚠️", "skip": "⏭️"}
-        data = []
-        for r in cat_results:
-            data.append({
-                "Status": icon_map.get(r.status.value, "❓"),
-                "Check ID": r.check_id,
-                "Name": r.name,
-                "Message": r.message
-            })
-        st.dataframe(data, use_container_width=True, hide_index=True)
+        st.dataframe(_category_table_rows(cat_results), use_container_width=True, hide_index=True)
 
     with tab_dev:
         render_category_table("developer")
@@ -223,12 +263,17 @@ def _render_results(report: QAReport, snapshot):
 
 
 # --- 4. ACTION HANDLERS ---
-import re
+# Re-running the same URL within the TTL reuses the earlier crawl. The leading
+# underscore keeps _output_dir (a fresh temp dir per run) out of the cache key.
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_crawl(url: str, screenshots: bool, _output_dir: str):
+    return crawl_sync(url, output_dir=_output_dir, screenshots=screenshots)
+
 
 def extract_asana_gid(url: str) -> str | None:
     if not url: return None
     # Asana GIDs are massive (15+ digits). We ignore '0' and short numbers.
-    matches = re.findall(r'\d{10,}', url)
+    matches = _ASANA_GID_RE.findall(url)
     if matches:
         return matches[-1]
     return None
@@ -251,7 +296,7 @@ def run_quick_start_mode(inputs, output_dir):
     try:
         with st.status("Running QA scan...", expanded=True) as status:
             st.write(f"🔍 Crawling {inputs['url']}...")
-            snapshot = crawl_sync(inputs["url"], output_dir=output_dir, screenshots=True)
+            snapshot = _cached_crawl(inputs["url"], True, output_dir)
 
             st.write(f"✅ Page loaded in {snapshot.load_time_ms}ms — "
                      f"{len(snapshot.images)} images, {len(snapshot.forms)} forms")
@@ -273,18 +318,16 @@ def run_quick_start_mode(inputs, output_dir):
                     st.session_state.asana_comment_gid = comment_gid
                 except Exception as e:
                     st.warning(f"Failed to post comment to Asana: {type(e).__name__} - {e}")
-                    import traceback
                     st.error("Asana Error Traceback:")
                     st.code(traceback.format_exc())
 
             st.write("📊 Generating report...")
-            md_path = to_markdown(report, output_dir)
             json_data = build_json(report)
 
             st.session_state.report = report
             st.session_state.snapshot = snapshot
-            st.session_state.md_content = Path(md_path).read_text()
-            st.session_state.json_data = json.dumps(json_data, indent=2)
+            st.session_state.md_content = render_markdown(report).encode("utf-8")
+            st.session_state.json_data = dump_json(json_data)
             st.session_state.batch_results = None
             if not (task_gid and inputs.get("asana_token")):
                 st.session_state.asana_comment_gid = None
@@ -304,7 +347,7 @@ def run_url_mode(inputs, output_dir):
 
     with st.status("Running QA scan...", expanded=True) as status:
         st.write(f"🔍 Crawling {inputs['url']}...")
-        snapshot = crawl_sync(inputs["url"], output_dir=output_dir, screenshots=True)
+        snapshot = _cached_crawl(inputs["url"], True, output_dir)
 
         st.write(f"✅ Page loaded in {snapshot.load_time_ms}ms — "
                  f"{len(snapshot.images)} images, {len(snapshot.forms)} forms")
@@ -324,13 +367,12 @@ def run_url_mode(inputs, output_dir):
         report.build_summary()
 
         st.write("📊 Generating report...")
-        md_path = to_markdown(report, output_dir)
         json_data = build_json(report)
 
         st.session_state.report = report
         st.session_state.snapshot = snapshot
-        st.session_state.md_content = Path(md_path).read_text()
-        st.session_state.json_data = json.dumps(json_data, indent=2)
+        st.session_state.md_content = render_markdown(report).encode("utf-8")
+        st.session_state.json_data = dump_json(json_data)
         st.session_state.batch_results = None  # Clear batch results
         st.session_state.asana_comment_gid = None
 
@@ -365,7 +407,7 @@ def run_asana_mode(inputs, output_dir):
                 return
 
             st.write(f"🔍 Crawling {ctx.landing_page_url}...")
-            snapshot = crawl_sync(ctx.landing_page_url, output_dir=output_dir, screenshots=True)
+            snapshot = _cached_crawl(ctx.landing_page_url, True, output_dir)
 
             st.write(f"✅ Page loaded in {snapshot.load_time_ms}ms")
             st.write("🧪 Running checks...")
@@ -382,13 +424,12 @@ def run_asana_mode(inputs, output_dir):
                     st.warning(f"Failed to post comment to Asana: {e}")
 
             st.write("📊 Generating report...")
-            md_path = to_markdown(report, output_dir)
             json_data = build_json(report)
             
             st.session_state.report = report
             st.session_state.snapshot = snapshot
-            st.session_state.md_content = Path(md_path).read_text()
-            st.session_state.json_data = json.dumps(json_data, indent=2)
+            st.session_state.md_content = render_markdown(report).encode("utf-8")
+            st.session_state.json_data = dump_json(json_data)
             st.session_state.batch_results = None
 
             status.update(label="✅ Scan complete!", state="complete")
@@ -396,6 +437,30 @@ def run_asana_mode(inputs, output_dir):
         os.environ.pop("ASANA_ACCESS_TOKEN", None)
 
 
+def _scan_batch_task(task, client, post_to_asana):
+    """Scan one batch task. Runs on a worker thread, so it must not call st.*.
+
+    Returns (report, snapshot, post_error); report is None when the task has no LP URL.
+    """
+    ctx = build_context_from_task(task, client=client)
+    if not ctx.landing_page_url:
+        return None, None, None
+
+    output_dir = tempfile.mkdtemp(prefix=f"qa_batch_{task['gid']}_")
+    snap = crawl_sync(ctx.landing_page_url, output_dir=output_dir, screenshots=True)
+    results = run_all(snap, ctx)
+    report = QAReport(context=ctx, results=results)
+    report.build_summary()
+
+    post_error = None
+    if post_to_asana:
+        try:
+            post_results(report, client=client)
+        except Exception as e:
+            post_error = e
+    return report, snap, post_error
+
+
 def run_batch_mode(inputs):
     if not inputs["asana_token"]:
         st.warning("Please enter an Asana Access Token.")
@@ -410,7 +475,8 @@ def run_batch_mode(inputs):
 
     try:
         try:
-            tasks = get_qa_tasks(inputs["project_gid"], inputs.get("section_name", "QA"))
+            client = get_client()
+            tasks = get_qa_tasks(inputs["project_gid"], inputs.get("section_name", "QA"), client=client)
         except Exception as e:
             st.error(f"Failed to load tasks from Asana. Check your token, Project GID, and Section Name. Error: {e}")
             return
@@ -421,32 +487,32 @@ def run_batch_mode(inputs):
             st.info("No incomplete tasks found in this section.")
             return
             
-        batch_results = []
         progress = st.progress(0, text="Starting batch scan...")
+        scanned = {}
 
-        for i, task in enumerate(tasks):
-            progress.progress((i + 1) / len(tasks), text=f"Scanning {task['name']} ({i+1}/{len(tasks)})...")
-            try:
-                ctx = build_context_from_task(task["gid"])
-                if not ctx.landing_page_url:
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(tasks))) as pool:
+            futures = {
+                pool.submit(_scan_batch_task, task, client, inputs.get("post_to_asana")): i
+                for i, task in enumerate(tasks)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                task = tasks[i]
+                progress.progress(done / len(tasks), text=f"Scanned {task['name']} ({done}/{len(tasks)})...")
+                try:
+                    report, snap, post_error = future.result()
+                except Exception as e:
+                    st.error(f"Failed to process {task['name']}: {e}")
+                    continue
+                if report is None:
                     st.warning(f"⏭️ Skipped '{task['name']}': No landing page URL in notes.")
                     continue
-                
-                output_dir = tempfile.mkdtemp(prefix=f"qa_batch_{task['gid']}_")
-                snap = crawl_sync(ctx.landing_page_url, output_dir=output_dir, screenshots=True)
-                results = run_all(snap, ctx)
-                report = QAReport(context=ctx, results=results)
-                report.build_summary()
-                
-                if inputs.get("post_to_asana"):
-                    try:
-                        post_results(report)
-                    except Exception as e:
-                        st.warning(f"Failed to post comment for {task['name']}: {e}")
-                        
-                batch_results.append((task["name"], report, snap))
-            except Exception as e:
-                st.error(f"Failed to process {task['name']}: {e}")
+                if post_error:
+                    st.warning(f"Failed to post comment for {task['name']}: {post_error}")
+                scanned[i] = (task["name"], report, snap)
+
+        # Keep the section's task order regardless of completion order
+        batch_results = [scanned[i] for i in sorted(scanned)]
 
         progress.progress(1.0, text=f"✅ Batch scan complete! Processed {len(tasks)} tasks.")
         st.session_state.batch_results = batch_results
@@ -530,8 +596,8 @@ def main():
 
         # Summary table
         summary_data = []
+        # Summaries were built once when each task finished scanning
         for task_name, task_report, _ in batch_results:
-            task_report.build_summary()
             s = task_report.summary
             summary_data.append({
                 "Task": task_name,
@@ -547,7 +613,6 @@ def main():
 
             # Per-task expandable detail
             for task_name, task_report, task_snapshot in batch_results:
-                task_report.build_summary()
                 with st.expander(f"{task_name} — {task_report.summary['pass_rate']} pass rate"):
                     _render_results(task_report, task_snapshot)
         else:
@@ -8,53 +8,77 @@ Requires ASANA_ACCESS_TOKEN environment variable.
 """
 from __future__ import annotations
 
+import functools
 import os
 import re
 from typing import Optional
 
+try:
+    import asana
+except ImportError:
+    asana = None
+
 from qa_agent.config import QAContext, QAReport
 
 
-def _get_client():
-    """Lazy-load Asana client."""
-    try:
-        import asana
-    except ImportError:
+# Task fields needed to build a QAContext
+TASK_OPT_FIELDS = [
+    "name", "notes", "custom_fields", "parent.name",
+    "memberships.section.name", "memberships.project.name",
+]
+
+_URL_RE = re.compile(r'https?://[^\s<>"\')\]]+')
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client_cached(token: str):
+    """Build an Asana client for a token. Cached so batch runs share one client."""
+    if asana is None:
         raise ImportError("Install asana: pip install asana")
 
+    client = asana.Client.access_token(token)
+    client.headers = {"asana-enable": "new_memberships,new_goal_memberships"}
+    return client
+
+
+def get_client():
+    """Return the Asana client for the current ASANA_ACCESS_TOKEN."""
     token = os.environ.get("ASANA_ACCESS_TOKEN")
     if not token:
         raise ValueError(
             "ASANA_ACCESS_TOKEN not set. "
             "Get a Personal Access Token from: https://app.asana.com/0/my-apps"
         )
-    print(f"DEBUG: asana module path: {getattr(asana, '__file__', 'Unknown')}")
-    print(f"DEBUG: asana version: {getattr(asana, '__version__', 'Unknown')}")
-    print(f"DEBUG: asana dir: {dir(asana)}")
-    
-    client = asana.Client.access_token(token)
-    client.headers = {"asana-enable": "new_memberships,new_goal_memberships"}
-    return client
+    return _get_client_cached(token)
 
 
 def _extract_urls_from_text(text: str) -> list[str]:
     """Pull all URLs from a text block."""
-    return re.findall(r'https?://[^\s<>"\')\]]+', text)
+    return _URL_RE.findall(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern:
+    """One case-insensitive alternation for a set of substring patterns."""
+    return re.compile("|".join(map(re.escape, patterns)), re.IGNORECASE)
 
 
 def _find_url_by_pattern(urls: list[str], patterns: list[str]) -> Optional[str]:
     """Find first URL matching any of the given patterns."""
+    pattern_re = _compile_patterns(tuple(patterns))
     for url in urls:
-        for p in patterns:
-            if p in url.lower():
-                return url
+        if pattern_re.search(url):
+            return url
     return None
 
 
-def build_context_from_task(task_gid: str) -> QAContext:
+def build_context_from_task(task: str | dict, client=None) -> QAContext:
     """
     Read an Asana task and extract QAContext.
 
+    `task` is either a task GID or a task dict already fetched with
+    TASK_OPT_FIELDS (as returned by get_qa_tasks), which skips the GET.
+
     Looks for URLs in Notes to identify:
     - Landing page URL (unbounce, instapage, or first non-internal URL)
     - Figma URL
@@ -62,14 +86,12 @@ def build_context_from_task(task_gid: str) -> QAContext:
 
     Also reads custom fields if available.
     """
-    client = _get_client()
-    task = client.tasks.get_task(
-        task_gid,
-        opt_fields=[
-            "name", "notes", "custom_fields", "parent.name",
-            "memberships.section.name", "memberships.project.name",
-        ],
-    )
+    if isinstance(task, dict):
+        task_gid = task["gid"]
+    else:
+        task_gid = task
+        client = client or get_client()
+        task = client.tasks.get_task(task_gid, opt_fields=TASK_OPT_FIELDS)
 
     name = task.get("name", "")
     notes = task.get("notes", "")
@@ -84,8 +106,9 @@ def build_context_from_task(task_gid: str) -> QAContext:
         # Fall back to first URL that looks like a landing page (not internal tools)
         internal = ["asana.com", "figma.com", "docs.google", "drive.google",
                      "slack.com", "whimsical.com", "canva.com"]
+        internal_re = _compile_patterns(tuple(internal))
         for url in urls:
-            if not any(i in url.lower() for i in internal):
+            if not internal_re.search(url):
                 lp_url = url
                 break
 
@@ -120,7 +143,7 @@ def build_context_from_task(task_gid: str) -> QAContext:
     )
 
 
-def post_results(report: QAReport) -> str:
+def post_results(report: QAReport, client=None) -> str:
     """
     Post QA results back to the Asana task as a comment.
 
@@ -132,7 +155,7 @@ def post_results(report: QAReport) -> str:
     from qa_agent.reporter import to_asana_comment
     comment_text = to_asana_comment(report)
 
-    client = _get_client()
+    client = client or get_client()
     result = client.tasks.add_comment(
         report.context.asana_task_id,
         {"text": comment_text},
@@ -140,28 +163,40 @@ def post_results(report: QAReport) -> str:
     return result.get("gid", "")
 
 
-def get_qa_tasks(project_gid: str, section_name: str = "QA") -> list[dict]:
+@functools.lru_cache(maxsize=64)
+def _resolve_section_gid(client, project_gid: str, section_name: str) -> str:
     """
-    List tasks in a specific section of an Asana project.
-    Useful for batch-running QA on all tasks that reach the QA stage.
+    Find the GID of the first section whose name contains section_name.
+
+    A section_name that is already a GID (all digits, more than 10 chars) is returned
+    as-is. Lookups are cached per client so repeat batch runs skip the listing.
     """
-    client = _get_client()
+    if section_name.isdigit() and len(section_name) > 10:
+        return section_name
 
-    # Find the section
     sections = list(client.sections.get_sections_for_project(project_gid))
-    target_section = None
     for sec in sections:
         if section_name.lower() in sec["name"].lower():
-            target_section = sec
-            break
+            return sec["gid"]
+
+    available = [s["name"] for s in sections]
+    raise ValueError(f"Section '{section_name}' not found. Available: {available}")
+
+
+def get_qa_tasks(project_gid: str, section_name: str = "QA", client=None) -> list[dict]:
+    """
+    List tasks in a specific section of an Asana project.
+    Useful for batch-running QA on all tasks that reach the QA stage.
+
+    Tasks include TASK_OPT_FIELDS and can be passed straight to build_context_from_task.
+    """
+    client = client or get_client()
 
-    if not target_section:
-        available = [s["name"] for s in sections]
-        raise ValueError(f"Section '{section_name}' not found. Available: {available}")
+    section_gid = _resolve_section_gid(client, project_gid, section_name)
 
-    # Get tasks in section
+    # Get tasks in section, with context fields so batch runs don't GET each task again
     tasks = list(client.tasks.get_tasks(
-        {"section": target_section["gid"]},
-        opt_fields=["name", "completed", "gid"],
+        {"section": section_gid},
+        opt_fields=["gid", "completed", *TASK_OPT_FIELDS],
     ))
     return [t for t in tasks if not t.get("completed")]
@@ -3,6 +3,9 @@ qa_agent/checks/__init__.py — Check registry.
 
 Each check module exposes a `run(snapshot, context) -> list[CheckResult]` function.
 """
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
 from qa_agent.checks.developer import run as run_developer
 from qa_agent.checks.designer import run as run_designer
 from qa_agent.checks.copywriter import run as run_copywriter
@@ -14,10 +17,15 @@ ALL_CHECK_MODULES = [
     ("copywriter", run_copywriter),
 ]
 
+# Shared across pages so each run_all() doesn't spin up its own thread pool
+_EXECUTOR = ThreadPoolExecutor(max_workers=len(ALL_CHECK_MODULES), thread_name_prefix="qa-checks")
+
 
 def run_all(snapshot, context) -> list:
-    """Run all check modules and return combined results."""
-    results = []
-    for _name, run_fn in ALL_CHECK_MODULES:
-        results.extend(run_fn(snapshot, context))
-    return results
+    """Run all check modules and return combined results.
+
+    Modules are independent, so they run on a small shared thread pool; results
+    keep the ALL_CHECK_MODULES order.
+    """
+    module_results = _EXECUTOR.map(lambda entry: entry[1](snapshot, context), ALL_CHECK_MODULES)
+    return list(chain.from_iterable(module_results))
@@ -6,73 +6,68 @@ Maps the 9 Asana checklist items for copywriter QA to automated checks.
 from __future__ import annotations
 
 import re
-from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor
 
 from qa_agent.config import CheckResult, CheckStatus, PageSnapshot, QAContext
+from qa_agent.dom import dom_index
 
 
-class _TextExtractor(HTMLParser):
-    """Extract visible text from HTML, skipping script/style."""
-    def __init__(self):
-        super().__init__()
-        self.text_parts = []
-        self._skip = False
+# Common typos / inconsistencies flagged by the spelling check, matched in one
+# pass. Only the typo group ignores case; the sentence-case group looks ahead at
+# the lowercase letter so a typo starting a sentence is still counted.
+_TYPO_WORDS = ("teh", "recieve", "occured", "seperate", "definately", "accomodate")
+_SENTENCE_LOWER_PATTERN = r'(?P<sentence_lower>[.!?]\s*(?=[a-z]))'
+_GRAMMAR_RE = re.compile(rf'(?P<typo>\b(?i:{"|".join(_TYPO_WORDS)})\b)|{_SENTENCE_LOWER_PATTERN}')
+# Used when a cheap substring test shows none of the typo words can match
+_SENTENCE_LOWER_RE = re.compile(_SENTENCE_LOWER_PATTERN)
+_GRAMMAR_ISSUES = {
+    "typo": "common misspelling",
+    "sentence_lower": "sentence starting with lowercase (may be intentional)",
+}
 
-    def handle_starttag(self, tag, attrs):
-        if tag in ("script", "style", "noscript"):
-            self._skip = True
+_VAGUE_CTAS = frozenset({"click here", "submit", "click", "go", "ok"})
 
-    def handle_endtag(self, tag):
-        if tag in ("script", "style", "noscript"):
-            self._skip = False
+# Shared across pages so each run() doesn't spin up its own thread pool
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="qa-copywriter")
 
-    def handle_data(self, data):
-        if not self._skip:
-            stripped = data.strip()
-            if stripped:
-                self.text_parts.append(stripped)
 
+def _visible_text(snap: PageSnapshot) -> str:
+    """Visible page text, parsed once per snapshot."""
+    return dom_index(snap).visible_text
 
-def _extract_visible_text(html: str) -> str:
-    parser = _TextExtractor()
-    try:
-        parser.feed(html)
-    except Exception:
-        pass
-    return " ".join(parser.text_parts)
+
+def _is_title_case(heading: str) -> bool:
+    """Every word starts with a capital letter (covers Title Case and ALL CAPS)."""
+    for word in heading.split():
+        first_alpha = next((c for c in word if c.isalpha()), None)
+        if first_alpha is not None and not first_alpha.isupper():
+            return False
+    return True
 
 
 def run(snapshot: PageSnapshot, ctx: QAContext) -> list[CheckResult]:
     """Run all copywriter QA checks."""
-    checks = [
-        _check_desktop_mobile_copy,
-        _check_spelling_grammar,
-        _check_capitalisation_consistency,
-        _check_accessibility_font_contrast,
-        _check_meta_page_title,
-        _check_general_ux_copy,
-        _check_cro_vault_entry,
-        _check_cta_copy_clarity,
-        _check_form_labels,
-    ]
-    results = []
-    for fn in checks:
-        try:
-            results.append(fn(snapshot, ctx))
-        except Exception as e:
-            results.append(CheckResult(
-                check_id=fn.__name__, name=fn.__name__.replace("_check_", "").replace("_", " ").title(),
-                category="copywriter", status=CheckStatus.WARN, message=f"Check error: {e}",
-            ))
-    return results
+    dom_index(snapshot)  # parse once up front rather than racing to parse in every worker
+    dynamic = iter(_EXECUTOR.map(lambda fn: _run_check(fn, snapshot, ctx), _DYNAMIC_CHECKS))
+    return [_STATIC_RESULTS[fn] if fn in _STATIC_RESULTS else next(dynamic) for fn in _CHECKS]
+
+
+def _run_check(fn, snapshot: PageSnapshot, ctx: QAContext) -> CheckResult:
+    """Run one check, turning an unexpected exception into a WARN result."""
+    try:
+        return fn(snapshot, ctx)
+    except Exception as e:
+        return CheckResult(
+            check_id=fn.__name__, name=_CHECK_NAMES[fn],
+            category="copywriter", status=CheckStatus.WARN, message=f"Check error: {e}",
+        )
 
 
 def _check_desktop_mobile_copy(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Check all the below for both Desktop and Mobile."""
     mobile = snap.mobile_snapshot or {}
-    desktop_text = _extract_visible_text(snap.dom_html)[:2000]
     # We can't extract full mobile HTML from snapshot, but we check structural parity
-    mobile_links = len(mobile.get("links", []))
+    mobile_links = len(mobile.get("links") or ())
     desktop_links = len(snap.links)
     if abs(mobile_links - desktop_links) > 5:
         return CheckResult(
@@ -94,24 +89,24 @@ def _check_desktop_mobile_copy(snap: PageSnapshot, ctx: QAContext) -> CheckResul
 
 def _check_spelling_grammar(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Consistent spelling and grammar including capitalisation."""
-    text = _extract_visible_text(snap.dom_html)
+    text = _visible_text(snap)
     # Basic heuristic checks
     issues = []
 
-    # Check for double spaces
-    double_spaces = len(re.findall(r'  +', text))
+    # Check for double spaces (counts space pairs, so a run of 4 counts twice)
+    double_spaces = text.count("  ")
     if double_spaces > 3:
         issues.append(f"{double_spaces} double-space occurrences")
 
     # Check for common typos / inconsistencies
-    typo_patterns = {
-        r'\b(teh|recieve|occured|seperate|definately|accomodate)\b': "common misspelling",
-        r'[.!?]\s*[a-z]': "sentence starting with lowercase (may be intentional)",
-    }
-    for pattern, desc in typo_patterns.items():
-        matches = re.findall(pattern, text, re.IGNORECASE if "misspelling" in desc else 0)
-        if matches:
-            issues.append(f"{desc}: found {len(matches)}")
+    text_lower = text.lower()
+    has_typo_words = any(w in text_lower for w in _TYPO_WORDS)
+    counts = dict.fromkeys(_GRAMMAR_ISSUES, 0)
+    for m in (_GRAMMAR_RE if has_typo_words else _SENTENCE_LOWER_RE).finditer(text):
+        counts[m.lastgroup] += 1
+    for group, desc in _GRAMMAR_ISSUES.items():
+        if counts[group]:
+            issues.append(f"{desc}: found {counts[group]}")
 
     if issues:
         return CheckResult(
@@ -133,10 +128,7 @@ def _check_spelling_grammar(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_capitalisation_consistency(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Consistent capitalisation across headings and CTAs."""
-    # Extract heading text
-    heading_pattern = re.compile(r'<h[1-6][^>]*>(.*?)</h[1-6]>', re.DOTALL | re.IGNORECASE)
-    headings = heading_pattern.findall(snap.dom_html)
-    heading_texts = [re.sub(r'<[^>]+>', '', h).strip() for h in headings if h.strip()]
+    heading_texts = dom_index(snap).headings
 
     if len(heading_texts) < 2:
         return CheckResult(
@@ -148,7 +140,7 @@ def _check_capitalisation_consistency(snap: PageSnapshot, ctx: QAContext) -> Che
         )
 
     # Classify: Title Case vs Sentence case
-    title_case = sum(1 for h in heading_texts if h == h.title() or h == h.upper())
+    title_case = sum(1 for h in heading_texts if _is_title_case(h))
     sentence_case = len(heading_texts) - title_case
     mixed = min(title_case, sentence_case) > 0
 
@@ -235,7 +227,7 @@ def _check_general_ux_copy(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
             message="No CTA buttons detected. Page may lack a clear call-to-action.",
         )
     cta_texts = [c.get("text", "").strip() for c in ctas if c.get("text", "").strip()]
-    vague_ctas = [t for t in cta_texts if t.lower() in ("click here", "submit", "click", "go", "ok")]
+    vague_ctas = [t for t in cta_texts if t.lower() in _VAGUE_CTAS]
     if vague_ctas:
         return CheckResult(
             check_id="ux_copy",
@@ -268,12 +260,10 @@ def _check_cro_vault_entry(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 def _check_cta_copy_clarity(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """CTA buttons use clear, benefit-driven copy."""
     # Already partially covered in ux_copy, this focuses on desktop
-    ctas = []
-    for link in snap.links:
-        text = link.get("text", "").strip()
-        if len(text) > 2 and len(text) < 50 and link.get("tag") in ("a", "button"):
-            ctas.append(text)
-    unique_ctas = list(set(ctas))
+    unique_ctas = list({
+        text for link in snap.links
+        if link.get("tag") in ("a", "button") and 2 < len(text := link.get("text", "").strip()) < 50
+    })
     if len(unique_ctas) > 5:
         return CheckResult(
             check_id="cta_clarity",
@@ -321,3 +311,24 @@ def _check_form_labels(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
         status=CheckStatus.PASS,
         message=f"All {len(all_fields)} form fields have labels or placeholder text.",
     )
+
+
+# Checklist order; run() reads these rather than rebuilding the list per page
+_CHECKS = (
+    _check_desktop_mobile_copy,
+    _check_spelling_grammar,
+    _check_capitalisation_consistency,
+    _check_accessibility_font_contrast,
+    _check_meta_page_title,
+    _check_general_ux_copy,
+    _check_cro_vault_entry,
+    _check_cta_copy_clarity,
+    _check_form_labels,
+)
+
+
+# Checks whose result never depends on the page, built once at import
+_STATIC_RESULTS = {fn: fn(None, None) for fn in (_check_accessibility_font_contrast, _check_cro_vault_entry)}
+_DYNAMIC_CHECKS = tuple(fn for fn in _CHECKS if fn not in _STATIC_RESULTS)
+# Display names for checks that raise, worked out once rather than per error
+_CHECK_NAMES = {fn: fn.__name__.replace("_check_", "").replace("_", " ").title() for fn in _CHECKS}
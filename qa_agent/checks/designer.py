@@ -5,36 +5,85 @@ Maps the 11 Asana checklist items for designer QA to automated checks.
 """
 from __future__ import annotations
 
-import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from qa_agent.config import CheckResult, CheckStatus, PageSnapshot, QAContext
+from qa_agent.dom import dom_index, html_lower
+
+
+_SYSTEM_FONTS = frozenset({"arial", "helvetica", "times new roman", "serif", "sans-serif",
+                           "monospace", "system-ui", "-apple-system", "segoe ui"})
+_PLACEHOLDER_HREFS = frozenset(("", "#", "javascript:void(0)", "javascript:;"))
+_ANIMATION_MARKERS = ("animation", "transition", "@keyframes", "animate", "aos", "wow",
+                      "gsap", "scroll-trigger", "intersection-observer")
+_ANIMATION_MARKER_BYTES = tuple((m, m.encode()) for m in _ANIMATION_MARKERS)
+
+# Shared across pages so each run() doesn't spin up its own thread pool
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="qa-designer")
+
+
+@dataclass(slots=True)
+class _PageStats:
+    """Designer metrics gathered in one sweep over the snapshot."""
+    placeholder_links: list[dict]
+    stretched_images: list[dict]
+    image_count: int
+    mobile_image_count: int
+    form_count: int
+    mobile_form_count: int
+    has_srcset: bool
+    has_picture: bool
+    animation_markers: list[str]
+
+
+def _collect_page_stats(snap: PageSnapshot) -> _PageStats:
+    mobile = snap.mobile_snapshot or {}
+    lowered = html_lower(snap)
+    stretched = [
+        img for img in snap.images
+        if img.get("naturalWidth") and img.get("width")
+        and img["width"] > 0
+        and abs(img["naturalWidth"] / img["width"] - 1) > 0.5
+        and img["naturalWidth"] > 50
+    ]
+    return _PageStats(
+        placeholder_links=[l for l in snap.links if l.get("href") in _PLACEHOLDER_HREFS],
+        stretched_images=stretched,
+        image_count=len(snap.images),
+        mobile_image_count=len(mobile.get("images") or ()),
+        form_count=len(snap.forms),
+        mobile_form_count=len(mobile.get("forms") or ()),
+        has_srcset="srcset" in snap.dom_html,
+        has_picture=b"<picture" in lowered,
+        animation_markers=[m for m, marker in _ANIMATION_MARKER_BYTES if marker in lowered],
+    )
+
+
+def _page_stats(snap: PageSnapshot) -> _PageStats:
+    """Designer metrics for the snapshot, collected once and shared by the checks."""
+    return snap.cached("designer_stats", lambda: _collect_page_stats(snap))
 
 
 def run(snapshot: PageSnapshot, ctx: QAContext) -> list[CheckResult]:
     """Run all designer QA checks."""
-    checks = [
-        _check_padding_spacing,
-        _check_fonts_correct,
-        _check_button_links,
-        _check_scroll_animations,
-        _check_sticky_cta_mobile,
-        _check_logo_no_link,
-        _check_desktop_mobile_parity,
-        _check_image_quality,
-        _check_color_contrast,
-        _check_responsive_images,
-        _check_visual_hierarchy,
-    ]
-    results = []
-    for fn in checks:
-        try:
-            results.append(fn(snapshot, ctx))
-        except Exception as e:
-            results.append(CheckResult(
-                check_id=fn.__name__, name=fn.__name__.replace("_check_", "").replace("_", " ").title(),
-                category="designer", status=CheckStatus.WARN, message=f"Check error: {e}",
-            ))
-    return results
+    try:
+        _page_stats(snapshot)  # collect once up front rather than racing to collect in every worker
+    except Exception:
+        pass  # each check that needs the stats will hit and report the error itself
+    dynamic = iter(_EXECUTOR.map(lambda fn: _run_check(fn, snapshot, ctx), _DYNAMIC_CHECKS))
+    return [_STATIC_RESULTS[fn] if fn in _STATIC_RESULTS else next(dynamic) for fn in _CHECKS]
+
+
+def _run_check(fn, snapshot: PageSnapshot, ctx: QAContext) -> CheckResult:
+    """Run one check, turning an unexpected exception into a WARN result."""
+    try:
+        return fn(snapshot, ctx)
+    except Exception as e:
+        return CheckResult(
+            check_id=fn.__name__, name=_CHECK_NAMES[fn],
+            category="designer", status=CheckStatus.WARN, message=f"Check error: {e}",
+        )
 
 
 def _check_padding_spacing(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
@@ -53,9 +102,7 @@ def _check_fonts_correct(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Double check fonts are correct."""
     fonts = snap.fonts_loaded
     # Flag common fallback-only scenarios
-    system_only = {"arial", "helvetica", "times new roman", "serif", "sans-serif",
-                   "monospace", "system-ui", "-apple-system", "segoe ui"}
-    custom = [f for f in fonts if f.lower() not in system_only]
+    custom = [f for f in fonts if f.lower() not in _SYSTEM_FONTS]
     if not custom:
         return CheckResult(
             check_id="fonts_correct",
@@ -76,9 +123,7 @@ def _check_fonts_correct(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_button_links(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Click all buttons to check links."""
-    links = snap.links
-    broken_href = [l for l in links if l.get("href") in ("", "#", "javascript:void(0)", "javascript:;")]
-    btn_links = [l for l in links if "btn" in l.get("href", "").lower() or "button" in l.get("tag", "")]
+    broken_href = _page_stats(snap).placeholder_links
     if broken_href:
         return CheckResult(
             check_id="button_links",
@@ -93,16 +138,13 @@ def _check_button_links(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
         name="Button links valid",
         category="designer",
         status=CheckStatus.PASS,
-        message=f"All {len(links)} links have non-empty href targets.",
+        message=f"All {len(snap.links)} links have non-empty href targets.",
     )
 
 
 def _check_scroll_animations(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Check all scroll animations, transitions and hover effects."""
-    html = snap.dom_html
-    animation_markers = ["animation", "transition", "@keyframes", "animate", "aos", "wow",
-                         "gsap", "scroll-trigger", "intersection-observer"]
-    found = [m for m in animation_markers if m.lower() in html.lower()]
+    found = _page_stats(snap).animation_markers
     if found:
         return CheckResult(
             check_id="scroll_animations",
@@ -144,22 +186,19 @@ def _check_sticky_cta_mobile(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_logo_no_link(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Check logo for link (Should not link out)."""
-    # Look for logo elements
-    html = snap.dom_html
-    logo_link_match = re.search(
-        r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>.*?(?:logo|brand).*?</a>',
-        html, re.IGNORECASE | re.DOTALL
+    # First anchor whose text or nested markup (img alt/src/class) mentions a logo
+    logo_href = next(
+        (href for href, inner in dom_index(snap).anchors if "logo" in inner or "brand" in inner),
+        None,
     )
-    if logo_link_match:
-        href = logo_link_match.group(1)
-        if href and href not in ("#", "/", "javascript:void(0)"):
-            return CheckResult(
-                check_id="logo_no_link",
-                name="Logo does not link out",
-                category="designer",
-                status=CheckStatus.FAIL,
-                message=f"Logo links to: {href[:80]}. Should not link away from the landing page.",
-            )
+    if logo_href and logo_href not in ("#", "/", "javascript:void(0)"):
+        return CheckResult(
+            check_id="logo_no_link",
+            name="Logo does not link out",
+            category="designer",
+            status=CheckStatus.FAIL,
+            message=f"Logo links to: {logo_href[:80]}. Should not link away from the landing page.",
+        )
     return CheckResult(
         check_id="logo_no_link",
         name="Logo does not link out",
@@ -171,11 +210,11 @@ def _check_logo_no_link(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_desktop_mobile_parity(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Check visual parity between desktop and mobile."""
-    mobile = snap.mobile_snapshot or {}
-    desktop_images = len(snap.images)
-    mobile_images = len(mobile.get("images", []))
-    desktop_forms = len(snap.forms)
-    mobile_forms = len(mobile.get("forms", []))
+    stats = _page_stats(snap)
+    desktop_images = stats.image_count
+    mobile_images = stats.mobile_image_count
+    desktop_forms = stats.form_count
+    mobile_forms = stats.mobile_form_count
 
     issues = []
     if desktop_forms != mobile_forms:
@@ -203,14 +242,7 @@ def _check_desktop_mobile_parity(snap: PageSnapshot, ctx: QAContext) -> CheckRes
 
 def _check_image_quality(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Check images are high quality and not stretched."""
-    images = snap.images
-    stretched = [
-        img for img in images
-        if img.get("naturalWidth") and img.get("width")
-        and img["width"] > 0
-        and abs(img["naturalWidth"] / img["width"] - 1) > 0.5
-        and img["naturalWidth"] > 50
-    ]
+    stretched = _page_stats(snap).stretched_images
     if stretched:
         return CheckResult(
             check_id="image_quality",
@@ -228,14 +260,12 @@ def _check_image_quality(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
         name="Image quality (no stretching)",
         category="designer",
         status=CheckStatus.PASS,
-        message=f"All {len(images)} images display at appropriate dimensions.",
+        message=f"All {len(snap.images)} images display at appropriate dimensions.",
     )
 
 
 def _check_color_contrast(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Accessibility: font size on mobile and colour contrast."""
-    mobile = snap.mobile_snapshot or {}
-    mobile_fonts = mobile.get("fonts", [])
     return CheckResult(
         check_id="color_contrast",
         name="Colour contrast & mobile font size",
@@ -248,9 +278,9 @@ def _check_color_contrast(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_responsive_images(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Check responsive image handling."""
-    html = snap.dom_html
-    has_srcset = "srcset" in html
-    has_picture = "<picture" in html.lower()
+    stats = _page_stats(snap)
+    has_srcset = stats.has_srcset
+    has_picture = stats.has_picture
     if has_srcset or has_picture:
         return CheckResult(
             check_id="responsive_images",
@@ -277,3 +307,29 @@ def _check_visual_hierarchy(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
         status=CheckStatus.SKIP,
         message="Visual hierarchy assessment requires human review against the approved design comp.",
     )
+
+
+# Checklist order; run() reads these rather than rebuilding the list per page
+_CHECKS = (
+    _check_padding_spacing,
+    _check_fonts_correct,
+    _check_button_links,
+    _check_scroll_animations,
+    _check_sticky_cta_mobile,
+    _check_logo_no_link,
+    _check_desktop_mobile_parity,
+    _check_image_quality,
+    _check_color_contrast,
+    _check_responsive_images,
+    _check_visual_hierarchy,
+)
+
+
+# Checks whose result never depends on the page, built once at import
+_STATIC_RESULTS = {
+    fn: fn(None, None)
+    for fn in (_check_padding_spacing, _check_color_contrast, _check_visual_hierarchy)
+}
+_DYNAMIC_CHECKS = tuple(fn for fn in _CHECKS if fn not in _STATIC_RESULTS)
+# Display names for checks that raise, worked out once rather than per error
+_CHECK_NAMES = {fn: fn.__name__.replace("_check_", "").replace("_", " ").title() for fn in _CHECKS}
@@ -9,65 +9,284 @@ Checks that require subjective human judgment are marked SKIP with guidance.
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from urllib.parse import urlparse, parse_qs
 
 from qa_agent.config import CheckResult, CheckStatus, PageSnapshot, QAContext
+from qa_agent.dom import html_lower
+
+
+_AUTOPLAY_RE = re.compile(r'autoplay["\s:]*(\d+)', re.IGNORECASE)
+_SPEED_RE = re.compile(r'(?:speed|delay|interval)["\s:]*(\d+)', re.IGNORECASE)
+_GENERIC_FIELD_RE = re.compile(r'^(field_?\d+|input\d+|q\d+)$', re.IGNORECASE)
+_SUSPICIOUS_VALUE_RE = re.compile(r'[{}<>]|%7[BbDd]|\{\{|\[\[')
+_GTM_ID_RE = re.compile(r'GTM-[A-Z0-9]{4,}')
+_STYLE_BLOCK_RE = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL)
+# Console errors from these sources are third-party noise
+_CONSOLE_NOISE_RE = re.compile(r'favicon|third-party|gtm|analytics|facebook|tiktok', re.IGNORECASE)
+
+# URL-parameter forwarding markers, one capture group each so a single scan
+# can tell which marker matched (label = group index - 1)
+_ULI_PARAM_PATTERNS = (
+    r'utm_', r'uli', r'gclid', r'fbclid', r'URLSearchParams',
+    r'window\.location\.search', r'getParam', r'queryString',
+)
+_ULI_PARAM_LABELS = tuple(p.replace("\\", "") for p in _ULI_PARAM_PATTERNS)
+_ULI_PARAMS_RE = re.compile("|".join(f"({p})" for p in _ULI_PARAM_PATTERNS), re.IGNORECASE)
+
+_CAROUSEL_MARKERS = ("carousel", "slider", "swiper", "slick", "owl-", "flickity", "glide")
+_CAROUSEL_MARKER_BYTES = tuple((m, m.encode()) for m in _CAROUSEL_MARKERS)
+# Markers of the carousel libraries that take an auto-transition speed
+_AUTO_CAROUSEL_MARKERS = ("carousel", "slider", "swiper", "slick")
+
+# CTA wording, matched anywhere in an element's text
+_STICKY_CTA_RE = re.compile(
+    r'get started|apply|enquire|contact|call|book|submit|learn more|sign up|register', re.IGNORECASE,
+)
+_SCROLL_CTA_RE = re.compile(r'get started|apply|enquire|contact|submit|learn more|sign up', re.IGNORECASE)
+_DEAD_HREFS = ("#", "javascript:void(0)", "")
+# Footer legal links by label. The longer phrasings ("terms of use", "terms and
+# conditions", "privacy policy") all contain the short keyword, so a single
+# alternation per label matches exactly what the full keyword lists did
+_LEGAL_LINK_RES = {
+    "terms": re.compile(r'terms|t&c', re.IGNORECASE),
+    "privacy": re.compile(r'privacy', re.IGNORECASE),
+    "disclaimer": re.compile(r'disclaimer', re.IGNORECASE),
+}
+_CDN_INDICATORS = ("cdn", "cloudfront", "cloudflare", "fastly", "akamai", "stackpath")
+
+# Most checks list at most this many offending items as evidence
+_EVIDENCE_LIMIT = 5
+
+# Shared across pages so each run() doesn't spin up its own thread pool
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="qa-developer")
+
+
+class _PageStats:
+    """Developer scratch data derived from the snapshot and shared by the checks.
+
+    Each field is computed on first use and memoised on the snapshot on its own,
+    so a malformed entry (a form without "fields", a script with a null src)
+    only breaks the checks that read that field.
+    """
+    __slots__ = ("_snap",)
+
+    def __init__(self, snap: PageSnapshot):
+        self._snap = snap
+
+    def _cached(self, key: str, compute):
+        return self._snap.cached(f"developer_stats.{key}", compute)
+
+    @property
+    def is_unbounce(self) -> bool:
+        snap = self._snap
+        if "is_unbounce" in snap.flags:
+            return snap.flags["is_unbounce"]
+        return self._cached("is_unbounce", lambda: (
+            b"unbounce" in html_lower(snap) or any("unbounce" in src for src in self.script_srcs_lower)
+        ))
+
+    @property
+    def carousel_markers(self) -> list[str]:
+        return self._cached("carousel_markers", lambda: [
+            m for m, marker in _CAROUSEL_MARKER_BYTES if marker in html_lower(self._snap)
+        ])
+
+    @property
+    def has_sms_verification(self) -> bool:
+        """The markup mentions SMS plus "verif" or "otp"."""
+        lowered = html_lower(self._snap)
+        return b"sms" in lowered and (b"verif" in lowered or b"otp" in lowered)
+
+    @property
+    def has_sms_code(self) -> bool:
+        """The markup mentions SMS plus "code"."""
+        lowered = html_lower(self._snap)
+        return b"sms" in lowered and b"code" in lowered
+
+    @property
+    def form_ids(self) -> list[str]:
+        return self._cached("form_ids", lambda: [f["id"] for f in self._snap.forms if f["id"]])
+
+    @property
+    def form_id_set(self) -> frozenset[str]:
+        return self._cached("form_id_set", lambda: frozenset(self.form_ids))
+
+    @property
+    def all_fields(self) -> list[dict]:
+        return self._cached("all_fields", lambda: [
+            f for form in self._snap.forms for f in form["fields"]
+        ])
+
+    @property
+    def required_fields(self) -> list[dict]:
+        return self._cached("required_fields", lambda: [f for f in self.all_fields if f.get("required")])
+
+    def _images(self) -> tuple[list[dict], list[dict], int, list[dict], int]:
+        return self._cached("images", lambda: _classify_images(self._snap.images))
+
+    @property
+    def broken_images(self) -> list[dict]:
+        """src set but 0 natural width."""
+        return self._images()[0]
+
+    @property
+    def large_pngs(self) -> list[dict]:
+        """Opaque PNGs wider than 200px."""
+        return self._images()[1]
+
+    @property
+    def oversized_count(self) -> int:
+        """Images wider than 2000px."""
+        return self._images()[2]
+
+    @property
+    def oversized_sample(self) -> list[dict]:
+        """The first _EVIDENCE_LIMIT oversized images, for evidence."""
+        return self._images()[3]
+
+    @property
+    def modern_image_count(self) -> int:
+        """WebP/AVIF images."""
+        return self._images()[4]
+
+    @property
+    def script_srcs_lower(self) -> tuple[str, ...]:
+        """Lowercased src of every script."""
+        return self._cached("script_srcs_lower", lambda: tuple(
+            (s.get("src", "") or "").lower() for s in self._snap.scripts
+        ))
+
+    @property
+    def request_urls_lower(self) -> tuple[str, ...]:
+        """Lowercased URL of every network request, in order."""
+        return self._cached("request_urls_lower", lambda: tuple(
+            (r.get("url", "") or "").lower() for r in self._snap.network_requests
+        ))
+
+    @property
+    def gtm_container_ids(self) -> list[str]:
+        """First few GTM-XXXX IDs in the markup."""
+        snap = self._snap
+        if snap.gtm_container_ids is not None:
+            return snap.gtm_container_ids
+        return self._cached("gtm_container_ids", lambda: _gtm_container_ids(snap.dom_html))
+
+    def _inline_css(self) -> tuple[int, int]:
+        snap = self._snap
+        if snap.inline_css_stats is not None:
+            return snap.inline_css_stats["chars"], snap.inline_css_stats["newlines"]
+        return self._cached("inline_css", lambda: _inline_css_size(snap.dom_html))
+
+    @property
+    def inline_css_chars(self) -> int:
+        """Total length of all <style> bodies."""
+        return self._inline_css()[0]
+
+    @property
+    def inline_css_newlines(self) -> int:
+        """Newlines within the <style> bodies."""
+        return self._inline_css()[1]
+
+    def _links(self) -> tuple[list[dict], list[dict]]:
+        return self._cached("links", lambda: _classify_links(self._snap.links))
+
+    @property
+    def dead_links(self) -> list[dict]:
+        return self._links()[0]
+
+    @property
+    def cta_anchors(self) -> list[dict]:
+        """In-page (#) links with CTA wording."""
+        return self._links()[1]
+
+
+def _classify_images(images: list[dict]) -> tuple[list[dict], list[dict], int, list[dict], int]:
+    """Sort images into broken / large opaque PNG / oversized buckets in one pass.
+
+    Oversized images are only counted, keeping the first few as evidence, so a
+    hero gallery of hundreds of full-resolution images doesn't build a full list.
+    """
+    broken, large_pngs, oversized = [], [], []
+    oversized_count = modern = 0
+    for img in images:
+        natural_width = img.get("naturalWidth", 0)
+        fmt = img.get("format")
+        if natural_width == 0 and img.get("src"):
+            broken.append(img)
+        if natural_width > 2000:
+            oversized_count += 1
+            if len(oversized) < _EVIDENCE_LIMIT:
+                oversized.append(img)
+        if fmt == "png":
+            # Heuristic: large PNGs without transparency probably don't need PNG
+            if not img.get("hasTransparency", False) and natural_width > 200:
+                large_pngs.append(img)
+        elif fmt in ("webp", "avif"):
+            modern += 1
+    return broken, large_pngs, oversized_count, oversized, modern
+
+
+def _classify_links(links: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Split links into dead/placeholder links and in-page CTA anchors in one pass."""
+    dead, cta_anchors = [], []
+    for link in links:
+        href = link.get("href")
+        if not href or href in _DEAD_HREFS:
+            dead.append(link)
+        if href and "#" in href and _SCROLL_CTA_RE.search(link.get("text", "")):
+            cta_anchors.append(link)
+    return dead, cta_anchors
+
+
+def _gtm_container_ids(html: str) -> list[str]:
+    """The first few GTM container IDs in the markup (only those are reported)."""
+    # A plain substring test first skips the regex on pages without any "GTM-"
+    if "GTM-" not in html:
+        return []
+    return [m.group() for m in islice(_GTM_ID_RE.finditer(html), 3)]
+
+
+def _inline_css_size(html: str) -> tuple[int, int]:
+    """(chars, newlines) across every <style> body, measured in place."""
+    css_chars = newlines = 0
+    for m in _STYLE_BLOCK_RE.finditer(html):
+        start, end = m.span(1)
+        css_chars += end - start
+        newlines += html.count("\n", start, end)
+    return css_chars, newlines
+
+
+def _page_stats(snap: PageSnapshot) -> _PageStats:
+    """Developer scratch data for the snapshot, shared by the checks."""
+    return snap.cached("developer_stats", lambda: _PageStats(snap))
 
 
 def run(snapshot: PageSnapshot, context: QAContext) -> list[CheckResult]:
     """Run all developer QA checks and return results."""
-    checks = [
-        _check_correct_group,
-        _check_new_variant,
-        _check_fonts_match,
-        _check_images_match_design,
-        _check_image_formats,
-        _check_sticky_cta_mobile,
-        _check_sticky_cta_text,
-        _check_price_updates,
-        _check_copy_matches,
-        _check_cta_scroll_target,
-        _check_cta_hover_color,
-        _check_carousel_functioning,
-        _check_carousel_transition,
-        _check_form_fields,
-        _check_field_names_standard,
-        _check_form_id,
-        _check_placeholder_styling,
-        _check_form_validation,
-        _check_form_values_no_codes,
-        _check_lead_submission,
-        _check_sms_client_name,
-        _check_sms_verification,
-        _check_redirect_thankyou,
-        _check_thankyou_redirect,
-        _check_uli_parameters,
-        _check_ux_testing,
-        _check_page_titles,
-        _check_console_errors,
-        _check_unused_scripts,
-        _check_urls_no_variant,
-        _check_page_speed,
-        _check_gtm_present,
-        _check_image_compression,
-        _check_code_minification,
-        _check_server_compression,
-        _check_footer_legal_links,
-        _check_cache_headers,
-    ]
-    results = []
-    for fn in checks:
-        try:
-            results.append(fn(snapshot, context))
-        except Exception as e:
-            results.append(CheckResult(
-                check_id=fn.__name__,
-                name=fn.__name__.replace("_check_", "").replace("_", " ").title(),
-                category="developer",
-                status=CheckStatus.WARN,
-                message=f"Check raised an error: {e}",
-            ))
-    return results
+    dynamic = iter(_EXECUTOR.map(lambda fn: _run_check(fn, snapshot, context), _DYNAMIC_CHECKS))
+    return [_STATIC_RESULTS[fn] if fn in _STATIC_RESULTS else next(dynamic) for fn in _CHECKS]
+
+
+def _run_check(fn, snapshot: PageSnapshot, context: QAContext) -> CheckResult:
+    """Run one check, turning an unexpected exception into a WARN result."""
+    try:
+        return fn(snapshot, context)
+    except Exception as e:
+        return CheckResult(
+            check_id=fn.__name__,
+            name=_CHECK_NAMES[fn],
+            category="developer",
+            status=CheckStatus.WARN,
+            message=f"Check raised an error: {e}",
+        )
+
+
+def _result(check_id: str, name: str) -> partial[CheckResult]:
+    """CheckResult factory with this check's id, name and category filled in."""
+    return partial(CheckResult, check_id=check_id, name=name, category="developer")
 
 
 # ── Individual checks ──
@@ -75,15 +294,10 @@ def run(snapshot: PageSnapshot, context: QAContext) -> list[CheckResult]:
 
 def _check_correct_group(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Ensure landing page is added to the correct group in Unbounce."""
+    result = _result("correct_group", "Landing page in correct Unbounce group")
     # Detect if this is an Unbounce page
-    is_unbounce = (
-        "unbounce" in snap.dom_html.lower()
-        or any("unbounce" in s.get("src", "").lower() for s in snap.scripts)
-    )
-    return CheckResult(
-        check_id="correct_group",
-        name="Landing page in correct Unbounce group",
-        category="developer",
+    is_unbounce = _page_stats(snap).is_unbounce
+    return result(
         status=CheckStatus.SKIP if not is_unbounce else CheckStatus.WARN,
         message="Unbounce detected — verify group assignment manually in Unbounce dashboard."
             if is_unbounce else "Non-Unbounce page or Unbounce not detected. Skip.",
@@ -93,13 +307,8 @@ def _check_correct_group(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_new_variant(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """For updates, ensure done on a new variant unless instructed otherwise."""
-    # Check URL for variant indicators (e.g., /a, /b, ?variant=)
-    url_lower = snap.final_url.lower()
-    has_variant = bool(re.search(r'[?&]variant=|/variant[/-]', url_lower))
-    return CheckResult(
-        check_id="new_variant",
-        name="Updates on new variant",
-        category="developer",
+    result = _result("new_variant", "Updates on new variant")
+    return result(
         status=CheckStatus.SKIP,
         message="Manual check: confirm this update was done on a new variant in Unbounce, not the live original.",
     )
@@ -107,24 +316,19 @@ def _check_new_variant(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_fonts_match(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Font family, colour, alignment and size match the design."""
+    result = _result("fonts_match", "Fonts match design")
     fonts = snap.fonts_loaded
     # Flag if system-only fonts are detected (potential missing web font)
     system_only = {"arial", "helvetica", "times new roman", "serif", "sans-serif", "monospace"}
     custom_fonts = [f for f in fonts if f.lower() not in system_only]
 
     if not custom_fonts:
-        return CheckResult(
-            check_id="fonts_match",
-            name="Fonts match design",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
             message="No custom web fonts detected — only system fonts found. Likely missing the design font.",
             evidence=f"Fonts found: {', '.join(fonts[:10])}",
         )
-    return CheckResult(
-        check_id="fonts_match",
-        name="Fonts match design",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message=f"Custom fonts loaded: {', '.join(custom_fonts[:5])}. Verify these match the Figma spec.",
         evidence=f"All fonts: {', '.join(fonts[:15])}",
@@ -133,29 +337,22 @@ def _check_fonts_match(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_images_match_design(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Images exactly the same as the ones in the design."""
+    result = _result("images_match", "Images match design")
     images = snap.images
-    broken = [img for img in images if img.get("naturalWidth", 0) == 0 and img.get("src")]
+    broken = _page_stats(snap).broken_images
     if broken:
-        return CheckResult(
-            check_id="images_match",
+        return result(
             name="Images match design (broken image check)",
-            category="developer",
             status=CheckStatus.FAIL,
             message=f"{len(broken)} broken image(s) detected (0 natural width).",
             evidence="\n".join(img["src"][:120] for img in broken[:5]),
         )
     if not images:
-        return CheckResult(
-            check_id="images_match",
-            name="Images match design",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
             message="No images found on page.",
         )
-    return CheckResult(
-        check_id="images_match",
-        name="Images match design",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message=f"{len(images)} images loaded, none broken. Visual match to design requires manual review.",
     )
@@ -163,71 +360,47 @@ def _check_images_match_design(snap: PageSnapshot, ctx: QAContext) -> CheckResul
 
 def _check_image_formats(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Use PNG only for transparent images; otherwise use modern formats (WebP)."""
+    result = _result("image_formats", "Image format optimisation")
     images = snap.images
     if not images:
-        return CheckResult(
-            check_id="image_formats",
-            name="Image format optimisation",
-            category="developer",
+        return result(
             status=CheckStatus.SKIP,
             message="No images on page.",
         )
-    non_transparent_pngs = [
-        img for img in images
-        if img.get("format") == "png" and not img.get("hasTransparency", False)
-    ]
-    # Heuristic: flag PNGs that are large and probably don't need transparency
-    large_pngs = [img for img in non_transparent_pngs if img.get("naturalWidth", 0) > 200]
+    stats = _page_stats(snap)
+    large_pngs = stats.large_pngs
 
     if large_pngs:
-        return CheckResult(
-            check_id="image_formats",
-            name="Image format optimisation",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
             message=f"{len(large_pngs)} PNG image(s) may not need transparency — consider WebP or AVIF.",
             evidence="\n".join(img["src"][:120] for img in large_pngs[:5]),
         )
 
     # Check for any WebP/AVIF usage (positive signal)
-    modern = [img for img in images if img.get("format") in ("webp", "avif")]
-    return CheckResult(
-        check_id="image_formats",
-        name="Image format optimisation",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
-        message=f"Image formats OK. {len(modern)} modern format(s) detected out of {len(images)} total.",
+        message=f"Image formats OK. {stats.modern_image_count} modern format(s) detected out of {len(images)} total.",
     )
 
 
 def _check_sticky_cta_mobile(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Sticky CTA bar has been added on mobile and is working accordingly."""
+    result = _result("sticky_cta_mobile", "Sticky CTA on mobile")
     mobile = snap.mobile_snapshot or {}
     sticky = mobile.get("sticky_elements", [])
     if not sticky:
-        return CheckResult(
-            check_id="sticky_cta_mobile",
-            name="Sticky CTA on mobile",
-            category="developer",
+        return result(
             status=CheckStatus.FAIL,
             message="No sticky/fixed elements detected on mobile viewport.",
         )
-    cta_like = [s for s in sticky if any(
-        kw in s.get("text", "").lower()
-        for kw in ["get started", "apply", "enquire", "contact", "call", "book", "submit", "learn more", "sign up", "register"]
-    )]
+    cta_like = [s for s in sticky if _STICKY_CTA_RE.search(s.get("text", ""))]
     if cta_like:
-        return CheckResult(
-            check_id="sticky_cta_mobile",
-            name="Sticky CTA on mobile",
-            category="developer",
+        return result(
             status=CheckStatus.PASS,
             message=f"Sticky CTA found on mobile: \"{cta_like[0]['text'][:80]}\"",
         )
-    return CheckResult(
-        check_id="sticky_cta_mobile",
-        name="Sticky CTA on mobile",
-        category="developer",
+    return result(
         status=CheckStatus.WARN,
         message=f"Sticky elements found ({len(sticky)}) but none look like a CTA. Manual verification needed.",
         evidence="\n".join(s["text"][:80] for s in sticky[:3]),
@@ -236,21 +409,16 @@ def _check_sticky_cta_mobile(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_sticky_cta_text(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Ensure sticky CTA bar has the correct CTA text (should reference form)."""
+    result = _result("sticky_cta_text", "Sticky CTA text matches brief")
     if not ctx.expected_cta_text:
-        return CheckResult(
-            check_id="sticky_cta_text",
-            name="Sticky CTA text matches brief",
-            category="developer",
+        return result(
             status=CheckStatus.SKIP,
             message="No expected CTA text provided in context. Provide expected_cta_text to enable.",
         )
     mobile = snap.mobile_snapshot or {}
     sticky = mobile.get("sticky_elements", [])
     found = any(ctx.expected_cta_text.lower() in s.get("text", "").lower() for s in sticky)
-    return CheckResult(
-        check_id="sticky_cta_text",
-        name="Sticky CTA text matches brief",
-        category="developer",
+    return result(
         status=CheckStatus.PASS if found else CheckStatus.FAIL,
         message=f"Expected CTA text '{ctx.expected_cta_text}' {'found' if found else 'NOT found'} in sticky elements.",
     )
@@ -258,10 +426,8 @@ def _check_sticky_cta_text(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_price_updates(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """For price updates, ensure updated on all necessary sections."""
-    return CheckResult(
-        check_id="price_updates",
-        name="Price consistency across sections",
-        category="developer",
+    result = _result("price_updates", "Price consistency across sections")
+    return result(
         status=CheckStatus.SKIP,
         message="Price validation requires brief context. Manual check: verify prices match across all page sections.",
     )
@@ -269,18 +435,13 @@ def _check_price_updates(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_copy_matches(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Copy exactly the same as the copy in copy doc."""
+    result = _result("copy_matches", "Copy matches copy doc")
     if not ctx.copy_doc_url:
-        return CheckResult(
-            check_id="copy_matches",
-            name="Copy matches copy doc",
-            category="developer",
+        return result(
             status=CheckStatus.SKIP,
             message="No copy doc URL provided. Provide copy_doc_url to enable automated comparison.",
         )
-    return CheckResult(
-        check_id="copy_matches",
-        name="Copy matches copy doc",
-        category="developer",
+    return result(
         status=CheckStatus.SKIP,
         message=f"Copy doc provided ({ctx.copy_doc_url[:60]}). Full text comparison requires Google Docs API integration (Phase 2).",
     )
@@ -288,38 +449,25 @@ def _check_copy_matches(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_cta_scroll_target(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Call to action button scrolls to the right place on the form."""
+    result = _result("cta_scroll_target", "CTA scrolls to form")
     # Check if any CTA links point to an anchor that matches the form
-    form_ids = [f["id"] for f in snap.forms if f["id"]]
-    cta_anchors = [
-        link for link in snap.links
-        if "#" in link.get("href", "") and any(
-            kw in link.get("text", "").lower()
-            for kw in ["get started", "apply", "enquire", "contact", "submit", "learn more", "sign up"]
-        )
-    ]
+    stats = _page_stats(snap)
+    form_ids = stats.form_ids
+    cta_anchors = stats.cta_anchors
     if not cta_anchors:
-        return CheckResult(
-            check_id="cta_scroll_target",
-            name="CTA scrolls to form",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
             message="No anchor-linked CTA buttons found. Manual check: verify CTAs scroll to form.",
         )
     # Check if anchor targets match form IDs
     for cta in cta_anchors:
         anchor = cta["href"].split("#")[-1]
-        if anchor in form_ids or anchor == ctx.expected_form_id.lstrip("#"):
-            return CheckResult(
-                check_id="cta_scroll_target",
-                name="CTA scrolls to form",
-                category="developer",
+        if anchor in stats.form_id_set or anchor == ctx.expected_form_id.lstrip("#"):
+            return result(
                 status=CheckStatus.PASS,
                 message=f"CTA \"{cta['text'][:50]}\" links to #{anchor} which matches a form on the page.",
             )
-    return CheckResult(
-        check_id="cta_scroll_target",
-        name="CTA scrolls to form",
-        category="developer",
+    return result(
         status=CheckStatus.WARN,
         message="CTA anchor targets don't match detected form IDs. Verify scroll target manually.",
         evidence=f"CTA targets: {[c['href'].split('#')[-1] for c in cta_anchors[:3]]}, Form IDs: {form_ids}",
@@ -328,38 +476,43 @@ def _check_cta_scroll_target(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_cta_hover_color(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Call to action buttons change to the correct colour on hover."""
-    # We check if CSS transitions are set on CTAs (can't fully test hover in headless)
-    has_transitions = "cta_has_transitions" in snap.dom_html  # placeholder
-    # Use the extracted flag from crawler
-    return CheckResult(
-        check_id="cta_hover_color",
-        name="CTA hover colour change",
-        category="developer",
+    result = _result("cta_hover_color", "CTA hover colour change")
+    # The crawler counts CTAs with CSS transitions (hover itself can't be tested headless)
+    stats = snap.cta_transition_stats
+    if not stats:
+        return result(
+            status=CheckStatus.WARN,
+            message="CTA transition data not captured for this page. Verify hover colours manually.",
+        )
+    if not stats["cta_count"]:
+        return result(
+            status=CheckStatus.WARN,
+            message="No CTA elements found to check for hover effects.",
+        )
+    if stats["transition_count"]:
+        return result(
+            status=CheckStatus.PASS,
+            message=f"CSS transitions detected on {stats['transition_count']} of {stats['cta_count']} CTA element(s) "
+                "— hover effect likely present. Visual verification recommended.",
+        )
+    return result(
         status=CheckStatus.WARN,
-        message="CSS transitions detected on CTA elements — hover effect likely present. Visual verification recommended.",
+        message=f"None of the {stats['cta_count']} CTA element(s) have CSS transitions. "
+            "Verify they change colour on hover.",
     )
 
 
 def _check_carousel_functioning(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Check carousel is functioning correctly and has the correct images loaded."""
+    result = _result("carousel_functioning", "Carousel functioning")
     # Look for carousel-like structures in the DOM
-    carousel_markers = [
-        "carousel", "slider", "swiper", "slick", "owl-", "flickity", "glide",
-    ]
-    html_lower = snap.dom_html.lower()
-    found_markers = [m for m in carousel_markers if m in html_lower]
+    found_markers = _page_stats(snap).carousel_markers
     if not found_markers:
-        return CheckResult(
-            check_id="carousel_functioning",
-            name="Carousel functioning",
-            category="developer",
+        return result(
             status=CheckStatus.SKIP,
             message="No carousel/slider elements detected on page.",
         )
-    return CheckResult(
-        check_id="carousel_functioning",
-        name="Carousel functioning",
-        category="developer",
+    return result(
         status=CheckStatus.WARN,
         message=f"Carousel detected ({', '.join(found_markers)}). Functionality requires interactive testing.",
     )
@@ -367,28 +520,21 @@ def _check_carousel_functioning(snap: PageSnapshot, ctx: QAContext) -> CheckResu
 
 def _check_carousel_transition(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """For carousels on automatic transition, ensure transition speed is correct."""
-    carousel_markers = ["carousel", "slider", "swiper", "slick"]
-    html_lower = snap.dom_html.lower()
-    if not any(m in html_lower for m in carousel_markers):
-        return CheckResult(
-            check_id="carousel_transition",
-            name="Carousel transition speed",
-            category="developer",
+    result = _result("carousel_transition", "Carousel transition speed")
+    if not any(m in _AUTO_CAROUSEL_MARKERS for m in _page_stats(snap).carousel_markers):
+        return result(
             status=CheckStatus.SKIP,
             message="No carousel detected.",
         )
     # Look for auto-play / transition speed settings
-    autoplay_match = re.search(r'autoplay["\s:]*(\d+)', snap.dom_html, re.IGNORECASE)
-    speed_match = re.search(r'(?:speed|delay|interval)["\s:]*(\d+)', snap.dom_html, re.IGNORECASE)
+    autoplay_match = _AUTOPLAY_RE.search(snap.dom_html)
+    speed_match = _SPEED_RE.search(snap.dom_html)
     evidence = []
     if autoplay_match:
         evidence.append(f"autoplay={autoplay_match.group(1)}ms")
     if speed_match:
         evidence.append(f"speed/delay={speed_match.group(1)}ms")
-    return CheckResult(
-        check_id="carousel_transition",
-        name="Carousel transition speed",
-        category="developer",
+    return result(
         status=CheckStatus.WARN,
         message="Carousel auto-transition settings detected. Verify speed meets requirements.",
         evidence=", ".join(evidence) if evidence else "No explicit speed values found in markup.",
@@ -397,57 +543,42 @@ def _check_carousel_transition(snap: PageSnapshot, ctx: QAContext) -> CheckResul
 
 def _check_form_fields(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Form fields match the design and brief."""
+    result = _result("form_fields", "Form fields present")
     forms = snap.forms
     if not forms:
-        return CheckResult(
-            check_id="form_fields",
-            name="Form fields present",
-            category="developer",
+        return result(
             status=CheckStatus.FAIL,
             message="No forms detected on the page.",
         )
-    total_fields = sum(len(f["fields"]) for f in forms)
-    field_summary = []
-    for form in forms:
-        for field in form["fields"]:
-            field_summary.append(f"{field['name'] or field['id']} ({field['type']})")
-    return CheckResult(
-        check_id="form_fields",
-        name="Form fields present",
-        category="developer",
+    all_fields = _page_stats(snap).all_fields
+    total_fields = len(all_fields)
+    field_summary = (f"{field['name'] or field['id']} ({field['type']})" for field in islice(all_fields, 15))
+    return result(
         status=CheckStatus.PASS,
         message=f"{len(forms)} form(s) with {total_fields} field(s) detected. Verify against brief.",
-        evidence="\n".join(field_summary[:15]),
+        evidence="\n".join(field_summary),
     )
 
 
 def _check_field_names_standard(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """When doing updates, ensure field names stay the same or use standard naming."""
+    result = _result("field_names", "Standard field naming")
     forms = snap.forms
     if not forms:
-        return CheckResult(
-            check_id="field_names",
-            name="Standard field naming",
-            category="developer",
+        return result(
             status=CheckStatus.SKIP,
             message="No forms found.",
         )
     # Check for common non-standard patterns
-    all_fields = [f for form in forms for f in form["fields"]]
-    suspicious = [f for f in all_fields if re.match(r'^(field_?\d+|input\d+|q\d+)$', f.get("name", ""), re.I)]
+    all_fields = _page_stats(snap).all_fields
+    suspicious = [f for f in all_fields if _GENERIC_FIELD_RE.match(f.get("name", ""))]
     if suspicious:
-        return CheckResult(
-            check_id="field_names",
-            name="Standard field naming",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
             message=f"{len(suspicious)} field(s) with generic names detected. May break integrations.",
             evidence=", ".join(f["name"] for f in suspicious[:5]),
         )
-    return CheckResult(
-        check_id="field_names",
-        name="Standard field naming",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message="Field names appear to follow standard naming conventions.",
     )
@@ -456,29 +587,21 @@ def _check_field_names_standard(snap: PageSnapshot, ctx: QAContext) -> CheckResu
 def _check_form_id(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Ensure the form uses this id: #lp-pom-form-42."""
     expected = ctx.expected_form_id
-    forms = snap.forms
-    form_ids = [f["id"] for f in forms if f["id"]]
-    if expected in form_ids:
-        return CheckResult(
-            check_id="form_id",
-            name=f"Form ID is {expected}",
-            category="developer",
+    result = _result("form_id", f"Form ID is {expected}")
+    stats = _page_stats(snap)
+    form_ids = stats.form_ids
+    if expected in stats.form_id_set:
+        return result(
             status=CheckStatus.PASS,
             message=f"Form with id='{expected}' found.",
         )
     if form_ids:
-        return CheckResult(
-            check_id="form_id",
-            name=f"Form ID is {expected}",
-            category="developer",
+        return result(
             status=CheckStatus.FAIL,
             message=f"Expected form id='{expected}' but found: {', '.join(form_ids)}",
             evidence=f"Form IDs on page: {form_ids}",
         )
-    return CheckResult(
-        check_id="form_id",
-        name=f"Form ID is {expected}",
-        category="developer",
+    return result(
         status=CheckStatus.FAIL,
         message=f"No forms with IDs found on page. Expected '{expected}'.",
     )
@@ -486,12 +609,13 @@ def _check_form_id(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_placeholder_styling(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Make sure form field placeholder text is lighter than typed text."""
-    # This requires CSS inspection — we check for ::placeholder rules
-    has_placeholder_style = "::placeholder" in snap.dom_html or "placeholder" in snap.dom_html.lower()
-    return CheckResult(
-        check_id="placeholder_styling",
-        name="Placeholder text styling",
-        category="developer",
+    result = _result("placeholder_styling", "Placeholder text styling")
+    # This requires CSS inspection — the crawler reads the stylesheets; snapshots
+    # without that flag fall back to a text search (which also covers ::placeholder)
+    has_placeholder_style = snap.flags.get("has_placeholder_css")
+    if has_placeholder_style is None:
+        has_placeholder_style = b"placeholder" in html_lower(snap)
+    return result(
         status=CheckStatus.WARN if not has_placeholder_style else CheckStatus.PASS,
         message="Placeholder styling rules found in page CSS."
             if has_placeholder_style
@@ -501,21 +625,16 @@ def _check_placeholder_styling(snap: PageSnapshot, ctx: QAContext) -> CheckResul
 
 def _check_form_validation(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Form field validation working on both mobile and desktop."""
+    result = _result("form_validation", "Form validation")
     forms = snap.forms
-    mobile_forms = (snap.mobile_snapshot or {}).get("forms", [])
     if not forms:
-        return CheckResult(
-            check_id="form_validation",
-            name="Form validation",
-            category="developer",
+        return result(
             status=CheckStatus.SKIP,
             message="No forms on page.",
         )
-    required_fields = [f for form in forms for f in form["fields"] if f.get("required")]
-    return CheckResult(
-        check_id="form_validation",
-        name="Form validation",
-        category="developer",
+    mobile_forms = (snap.mobile_snapshot or {}).get("forms", [])
+    required_fields = _page_stats(snap).required_fields
+    return result(
         status=CheckStatus.PASS if required_fields else CheckStatus.WARN,
         message=f"{len(required_fields)} required field(s) with HTML validation. "
             f"Desktop forms: {len(forms)}, Mobile forms: {len(mobile_forms)}. "
@@ -525,26 +644,18 @@ def _check_form_validation(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_form_values_no_codes(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Ensure form field values do not contain any codes."""
-    forms = snap.forms
-    suspicious_values = []
-    for form in forms:
-        for field in form["fields"]:
-            val = field.get("value", "")
-            if val and re.search(r'[{}<>]|%7[Bb]|%7[Dd]|\{\{|\[\[', val):
-                suspicious_values.append(f"{field['name']}={val[:50]}")
-    if suspicious_values:
-        return CheckResult(
-            check_id="form_values_clean",
-            name="Form values free of codes",
-            category="developer",
+    result = _result("form_values_clean", "Form values free of codes")
+    suspicious_fields = [
+        field for field in _page_stats(snap).all_fields
+        if (val := field.get("value", "")) and _SUSPICIOUS_VALUE_RE.search(val)
+    ]
+    if suspicious_fields:
+        return result(
             status=CheckStatus.FAIL,
-            message=f"Found {len(suspicious_values)} field(s) with suspicious code-like values.",
-            evidence="\n".join(suspicious_values[:5]),
+            message=f"Found {len(suspicious_fields)} field(s) with suspicious code-like values.",
+            evidence="\n".join(f"{field['name']}={field['value'][:50]}" for field in suspicious_fields[:5]),
         )
-    return CheckResult(
-        check_id="form_values_clean",
-        name="Form values free of codes",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message="No code-like values found in form field defaults.",
     )
@@ -552,10 +663,8 @@ def _check_form_values_no_codes(snap: PageSnapshot, ctx: QAContext) -> CheckResu
 
 def _check_lead_submission(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """You are able to submit a lead and check download is working."""
-    return CheckResult(
-        check_id="lead_submission",
-        name="Lead submission test",
-        category="developer",
+    result = _result("lead_submission", "Lead submission test")
+    return result(
         status=CheckStatus.SKIP,
         message="Live form submission requires a test harness with known-good data. "
             "Enable with --test-submit flag once test data is configured.",
@@ -564,20 +673,13 @@ def _check_lead_submission(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_sms_client_name(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """For SMS Verification, ensure that the client name is updated."""
-    html_lower = snap.dom_html.lower()
-    has_sms = "sms" in html_lower and ("verif" in html_lower or "otp" in html_lower)
-    if not has_sms:
-        return CheckResult(
-            check_id="sms_client_name",
-            name="SMS verification client name",
-            category="developer",
+    result = _result("sms_client_name", "SMS verification client name")
+    if not _page_stats(snap).has_sms_verification:
+        return result(
             status=CheckStatus.SKIP,
             message="No SMS verification detected on page.",
         )
-    return CheckResult(
-        check_id="sms_client_name",
-        name="SMS verification client name",
-        category="developer",
+    return result(
         status=CheckStatus.WARN,
         message="SMS verification detected. Manually verify the client name is correct in the SMS message.",
     )
@@ -585,20 +687,14 @@ def _check_sms_client_name(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_sms_verification(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Make sure SMS verification is showing and functioning."""
-    html_lower = snap.dom_html.lower()
-    has_sms = "sms" in html_lower and ("verif" in html_lower or "otp" in html_lower or "code" in html_lower)
-    if not has_sms:
-        return CheckResult(
-            check_id="sms_verification",
-            name="SMS verification present",
-            category="developer",
+    result = _result("sms_verification", "SMS verification present")
+    stats = _page_stats(snap)
+    if not (stats.has_sms_verification or stats.has_sms_code):
+        return result(
             status=CheckStatus.SKIP,
             message="No SMS verification elements detected.",
         )
-    return CheckResult(
-        check_id="sms_verification",
-        name="SMS verification present",
-        category="developer",
+    return result(
         status=CheckStatus.WARN,
         message="SMS verification markup detected. Interactive test required to verify end-to-end flow.",
     )
@@ -606,19 +702,14 @@ def _check_sms_verification(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_redirect_thankyou(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Landing page redirects to the thank you / profile page after submission."""
+    result = _result("redirect_thankyou", "Redirect to thank-you page")
     if ctx.thank_you_url:
-        return CheckResult(
-            check_id="redirect_thankyou",
-            name="Redirect to thank-you page",
-            category="developer",
+        return result(
             status=CheckStatus.SKIP,
             message=f"Thank-you URL configured ({ctx.thank_you_url[:60]}). "
                 "Redirect testing requires live form submission.",
         )
-    return CheckResult(
-        check_id="redirect_thankyou",
-        name="Redirect to thank-you page",
-        category="developer",
+    return result(
         status=CheckStatus.SKIP,
         message="Provide thank_you_url in context to enable redirect validation after form submission.",
     )
@@ -626,10 +717,8 @@ def _check_redirect_thankyou(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_thankyou_redirect(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Thank you / profile page redirects to a confirmation page."""
-    return CheckResult(
-        check_id="thankyou_redirect",
-        name="Thank-you → confirmation redirect",
-        category="developer",
+    result = _result("thankyou_redirect", "Thank-you → confirmation redirect")
+    return result(
         status=CheckStatus.SKIP,
         message="Multi-step redirect chain testing requires sequential page navigation. "
             "Enable with --test-submit once form submission is configured.",
@@ -638,25 +727,20 @@ def _check_thankyou_redirect(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_uli_parameters(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Ensure links carry over ULI/UTM parameters."""
+    result = _result("uli_parameters", "URL parameter pass-through")
     # Check if the page JS handles URL parameter forwarding
-    html = snap.dom_html
-    param_patterns = [
-        r'utm_', r'uli', r'gclid', r'fbclid', r'URLSearchParams',
-        r'window\.location\.search', r'getParam', r'queryString',
-    ]
-    found = [p.replace("\\", "") for p in param_patterns if re.search(p, html, re.IGNORECASE)]
+    hits = set()
+    for m in _ULI_PARAMS_RE.finditer(snap.dom_html):
+        hits.add(m.lastindex)
+        if len(hits) == len(_ULI_PARAM_LABELS):
+            break  # every marker seen, no need to scan the rest of the page
+    found = [_ULI_PARAM_LABELS[i - 1] for i in sorted(hits)]
     if found:
-        return CheckResult(
-            check_id="uli_parameters",
-            name="URL parameter pass-through",
-            category="developer",
+        return result(
             status=CheckStatus.PASS,
             message=f"URL parameter handling detected in page scripts: {', '.join(found[:3])}",
         )
-    return CheckResult(
-        check_id="uli_parameters",
-        name="URL parameter pass-through",
-        category="developer",
+    return result(
         status=CheckStatus.WARN,
         message="No URL parameter forwarding logic detected in page scripts. "
             "Manually test: add ?utm_source=test to URL and verify it carries to form submission / thank-you page.",
@@ -665,23 +749,18 @@ def _check_uli_parameters(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_ux_testing(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """UX testing across all pages (click on anything that can be clicked)."""
+    result = _result("ux_testing", "Interactive elements UX")
     # Count interactive elements
     total_links = len(snap.links)
     total_forms = len(snap.forms)
-    dead_links = [l for l in snap.links if not l.get("href") or l["href"] in ("#", "javascript:void(0)", "")]
+    dead_links = _page_stats(snap).dead_links
     if dead_links:
-        return CheckResult(
-            check_id="ux_testing",
-            name="Interactive elements UX",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
             message=f"{len(dead_links)} dead/placeholder link(s) found out of {total_links} total.",
             evidence="\n".join(f'"{l["text"][:40]}" → {l["href"][:60]}' for l in dead_links[:5]),
         )
-    return CheckResult(
-        check_id="ux_testing",
-        name="Interactive elements UX",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message=f"{total_links} links and {total_forms} forms found. No dead links detected.",
     )
@@ -689,28 +768,20 @@ def _check_ux_testing(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_page_titles(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Page titles (LCP, thank-you and confirmation) correspond correctly."""
+    result = _result("page_titles", "Page title set")
     title = snap.title
     meta = snap.meta_title
     if not title:
-        return CheckResult(
-            check_id="page_titles",
-            name="Page title set",
-            category="developer",
+        return result(
             status=CheckStatus.FAIL,
             message="Page has no <title> tag.",
         )
     if ctx.client_name and ctx.client_name.lower() not in title.lower():
-        return CheckResult(
-            check_id="page_titles",
-            name="Page title set",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
             message=f"Page title '{title[:60]}' does not contain client name '{ctx.client_name}'.",
         )
-    return CheckResult(
-        check_id="page_titles",
-        name="Page title set",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message=f"Title: '{title[:80]}'" + (f" | OG: '{meta[:80]}'" if meta else ""),
     )
@@ -718,34 +789,22 @@ def _check_page_titles(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_console_errors(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Check console any time code is edited to ensure there are no errors."""
+    result = _result("console_errors", "No console errors")
     errors = snap.console_errors
     # Filter out common noise
-    noise_patterns = ["favicon", "third-party", "gtm", "analytics", "facebook", "tiktok"]
-    real_errors = [
-        e for e in errors
-        if not any(n in e.get("text", "").lower() for n in noise_patterns)
-    ]
+    real_errors = [e for e in errors if not _CONSOLE_NOISE_RE.search(e.get("text", ""))]
     if real_errors:
-        return CheckResult(
-            check_id="console_errors",
-            name="No console errors",
-            category="developer",
+        return result(
             status=CheckStatus.FAIL,
             message=f"{len(real_errors)} console error(s) detected (excluding third-party noise).",
             evidence="\n".join(f"[{e['type']}] {e['text'][:100]}" for e in real_errors[:5]),
         )
     if errors:
-        return CheckResult(
-            check_id="console_errors",
-            name="No console errors",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
             message=f"{len(errors)} console error(s) detected, but all appear to be third-party (GTM, analytics, etc.).",
         )
-    return CheckResult(
-        check_id="console_errors",
-        name="No console errors",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message="No console errors detected.",
     )
@@ -753,49 +812,43 @@ def _check_console_errors(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_unused_scripts(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Cleanup unused scripts."""
-    scripts = snap.scripts
-    external = [s for s in scripts if s.get("src")]
-    inline = [s for s in scripts if s.get("inline_length", 0) > 0]
-    total_inline_bytes = sum(s.get("inline_length", 0) for s in inline)
+    result = _result("unused_scripts", "Script cleanup")
+    external = inline = total_inline_bytes = 0
+    for s in snap.scripts:
+        if s.get("src"):
+            external += 1
+        inline_length = s.get("inline_length", 0)
+        if inline_length > 0:
+            inline += 1
+            total_inline_bytes += inline_length
 
     if total_inline_bytes > 50_000:
-        return CheckResult(
-            check_id="unused_scripts",
-            name="Script cleanup",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
-            message=f"{len(external)} external + {len(inline)} inline scripts. "
+            message=f"{external} external + {inline} inline scripts. "
                 f"Total inline JS: {total_inline_bytes:,} bytes — may contain unused code.",
         )
-    return CheckResult(
-        check_id="unused_scripts",
-        name="Script cleanup",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
-        message=f"{len(external)} external + {len(inline)} inline scripts. "
+        message=f"{external} external + {inline} inline scripts. "
             f"Inline JS: {total_inline_bytes:,} bytes.",
     )
 
 
 def _check_urls_no_variant(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Make sure URLs do not contain the variant letter when copied."""
+    result = _result("urls_no_variant", "URL free of variant letter")
     url = snap.final_url
-    # Unbounce variants typically end with /a, /b, /c etc.
-    variant_match = re.search(r'/([a-c])/?$', url)
-    if variant_match:
-        return CheckResult(
-            check_id="urls_no_variant",
-            name="URL free of variant letter",
-            category="developer",
+    # Unbounce variants typically end with /a, /b, /c etc. (one optional trailing slash)
+    tail = url.removesuffix("/")[-2:]
+    if len(tail) == 2 and tail[0] == "/" and tail[1] in "abc":
+        return result(
             status=CheckStatus.FAIL,
-            message=f"URL contains variant letter '/{variant_match.group(1)}'. "
+            message=f"URL contains variant letter '{tail}'. "
                 "Published URL should not expose the variant.",
             evidence=url,
         )
-    return CheckResult(
-        check_id="urls_no_variant",
-        name="URL free of variant letter",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message="URL does not contain a variant letter suffix.",
     )
@@ -803,27 +856,19 @@ def _check_urls_no_variant(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_image_compression(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Compress images, use modern formats (e.g., WebP), and optimise sizes."""
+    result = _result("image_compression", "Image compression & sizing")
     images = snap.images
-    oversized = [
-        img for img in images
-        if img.get("naturalWidth", 0) > 2000
-    ]
-    if oversized:
-        return CheckResult(
-            check_id="image_compression",
-            name="Image compression & sizing",
-            category="developer",
+    stats = _page_stats(snap)
+    if stats.oversized_count:
+        return result(
             status=CheckStatus.WARN,
-            message=f"{len(oversized)} image(s) wider than 2000px — likely unoptimised.",
+            message=f"{stats.oversized_count} image(s) wider than 2000px — likely unoptimised.",
             evidence="\n".join(
                 f"{img['src'][:80]} ({img['naturalWidth']}×{img.get('naturalHeight', '?')}px)"
-                for img in oversized[:5]
+                for img in stats.oversized_sample
             ),
         )
-    return CheckResult(
-        check_id="image_compression",
-        name="Image compression & sizing",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message=f"All {len(images)} images within reasonable dimensions.",
     )
@@ -831,25 +876,18 @@ def _check_image_compression(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_code_minification(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Minify, compress, remove unused code, and load critical CSS first."""
+    result = _result("code_minification", "Code minification")
     # Heuristic: check if inline scripts / styles look minified (low whitespace ratio)
-    html = snap.dom_html
-    style_blocks = re.findall(r'<style[^>]*>(.*?)</style>', html, re.DOTALL)
-    total_css = "".join(style_blocks)
-    if total_css:
-        newlines = total_css.count("\n")
-        ratio = newlines / max(len(total_css), 1) * 1000
+    stats = _page_stats(snap)
+    css_chars, newlines = stats.inline_css_chars, stats.inline_css_newlines
+    if css_chars:
+        ratio = newlines / css_chars * 1000
         if ratio > 5:  # roughly: more than 5 newlines per 1000 chars = not minified
-            return CheckResult(
-                check_id="code_minification",
-                name="Code minification",
-                category="developer",
+            return result(
                 status=CheckStatus.WARN,
-                message=f"Inline CSS ({len(total_css):,} chars) appears unminified ({newlines} newlines). Consider minifying.",
+                message=f"Inline CSS ({css_chars:,} chars) appears unminified ({newlines} newlines). Consider minifying.",
             )
-    return CheckResult(
-        check_id="code_minification",
-        name="Code minification",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message="Inline code appears reasonably minified.",
     )
@@ -857,27 +895,19 @@ def _check_code_minification(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_server_compression(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Ensure Gzip or Brotli compression is enabled for text-based resources."""
+    result = _result("server_compression", "Server compression (Gzip/Brotli)")
     comp = snap.compression
     if comp == "br":
-        return CheckResult(
-            check_id="server_compression",
-            name="Server compression (Gzip/Brotli)",
-            category="developer",
+        return result(
             status=CheckStatus.PASS,
             message="Brotli compression enabled. ✓",
         )
     if comp == "gzip":
-        return CheckResult(
-            check_id="server_compression",
-            name="Server compression (Gzip/Brotli)",
-            category="developer",
+        return result(
             status=CheckStatus.PASS,
             message="Gzip compression enabled. Consider upgrading to Brotli for better compression.",
         )
-    return CheckResult(
-        check_id="server_compression",
-        name="Server compression (Gzip/Brotli)",
-        category="developer",
+    return result(
         status=CheckStatus.FAIL,
         message="No Gzip or Brotli compression detected on the page response. Enable server compression.",
     )
@@ -885,30 +915,22 @@ def _check_server_compression(snap: PageSnapshot, ctx: QAContext) -> CheckResult
 
 def _check_page_speed(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Page loading speed < 4 seconds first paint on Google Speed Test (DEV-030)."""
+    result = _result("page_speed", "Page load speed < 4s")
     load_ms = snap.load_time_ms
     threshold_ms = 4000
     if load_ms > threshold_ms:
-        return CheckResult(
-            check_id="page_speed",
-            name="Page load speed < 4s",
-            category="developer",
+        return result(
             status=CheckStatus.FAIL,
             message=f"Page load time {load_ms}ms exceeds {threshold_ms}ms threshold.",
             evidence=f"load_time_ms={load_ms}",
         )
     if load_ms > threshold_ms * 0.75:  # warn above 3s
-        return CheckResult(
-            check_id="page_speed",
-            name="Page load speed < 4s",
-            category="developer",
+        return result(
             status=CheckStatus.WARN,
             message=f"Page load time {load_ms}ms is approaching the {threshold_ms}ms threshold.",
             evidence=f"load_time_ms={load_ms}",
         )
-    return CheckResult(
-        check_id="page_speed",
-        name="Page load speed < 4s",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message=f"Page loaded in {load_ms}ms (threshold: {threshold_ms}ms).",
     )
@@ -916,18 +938,15 @@ def _check_page_speed(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_gtm_present(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """GTM implemented and set up correctly (DEV-032)."""
+    result = _result("gtm_present", "GTM implemented")
     # Check scripts for GTM
-    gtm_in_scripts = any(
-        "googletagmanager.com" in s.get("src", "").lower()
-        for s in snap.scripts
-    )
+    stats = _page_stats(snap)
+    gtm_in_scripts = any("googletagmanager.com" in src for src in stats.script_srcs_lower)
     # Check network requests for GTM
-    gtm_in_network = any(
-        "googletagmanager.com" in r.get("url", "").lower()
-        for r in snap.network_requests
-    )
+    gtm_in_network = any("googletagmanager.com" in url for url in stats.request_urls_lower)
     # Check inline scripts for GTM container ID pattern
-    gtm_in_html = bool(re.search(r'GTM-[A-Z0-9]{4,}', snap.dom_html))
+    container_ids = stats.gtm_container_ids
+    gtm_in_html = bool(container_ids)
 
     if gtm_in_scripts or gtm_in_network or gtm_in_html:
         evidence_parts = []
@@ -936,19 +955,12 @@ def _check_gtm_present(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
         if gtm_in_network:
             evidence_parts.append("GTM network request detected")
         if gtm_in_html:
-            container_ids = re.findall(r'GTM-[A-Z0-9]{4,}', snap.dom_html)
-            evidence_parts.append(f"Container ID(s): {', '.join(set(container_ids[:3]))}")
-        return CheckResult(
-            check_id="gtm_present",
-            name="GTM implemented",
-            category="developer",
+            evidence_parts.append(f"Container ID(s): {', '.join(set(container_ids))}")
+        return result(
             status=CheckStatus.PASS,
             message=f"Google Tag Manager detected. {'; '.join(evidence_parts)}.",
         )
-    return CheckResult(
-        check_id="gtm_present",
-        name="GTM implemented",
-        category="developer",
+    return result(
         status=CheckStatus.FAIL,
         message="No Google Tag Manager detected in scripts, network requests, or page markup.",
     )
@@ -956,40 +968,30 @@ def _check_gtm_present(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
 
 def _check_footer_legal_links(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Terms & Conditions, Privacy Policy, Disclaimer links verified in footer (DEV-041)."""
-    required_patterns = {
-        "terms": ["terms", "t&c", "terms and conditions", "terms of use", "terms of service"],
-        "privacy": ["privacy", "privacy policy"],
-        "disclaimer": ["disclaimer"],
-    }
-    found = {}
-    missing = []
-
-    for label, patterns in required_patterns.items():
-        matched = False
-        for link in snap.links:
-            link_text = link.get("text", "").lower()
-            link_href = link.get("href", "").lower()
-            if any(p in link_text or p in link_href for p in patterns):
-                if link.get("href") and link["href"] not in ("", "#", "javascript:void(0)"):
-                    found[label] = link["href"][:80]
-                    matched = True
-                    break
-        if not matched:
-            missing.append(label)
+    result = _result("footer_legal_links", "Footer legal links (T&C, Privacy, Disclaimer)")
+    # One walk over the links: placeholder hrefs are skipped before any pattern
+    # runs, and each label keeps the first link that matches it
+    first_match = {}
+    for link in snap.links:
+        href = link.get("href")
+        if not href or href in ("#", "javascript:void(0)"):
+            continue
+        text = link.get("text", "")
+        for label, pattern in _LEGAL_LINK_RES.items():
+            if label not in first_match and (pattern.search(text) or pattern.search(href)):
+                first_match[label] = href[:80]
+        if len(first_match) == len(_LEGAL_LINK_RES):
+            break
+    found = {label: first_match[label] for label in _LEGAL_LINK_RES if label in first_match}
+    missing = [label for label in _LEGAL_LINK_RES if label not in first_match]
 
     if missing:
-        return CheckResult(
-            check_id="footer_legal_links",
-            name="Footer legal links (T&C, Privacy, Disclaimer)",
-            category="developer",
+        return result(
             status=CheckStatus.FAIL if "privacy" in missing else CheckStatus.WARN,
             message=f"Missing footer link(s): {', '.join(missing)}.",
             evidence=f"Found: {found}" if found else None,
         )
-    return CheckResult(
-        check_id="footer_legal_links",
-        name="Footer legal links (T&C, Privacy, Disclaimer)",
-        category="developer",
+    return result(
         status=CheckStatus.PASS,
         message=f"All required legal links found: {', '.join(found.keys())}.",
         evidence="\n".join(f"{k}: {v}" for k, v in found.items()),
@@ -998,38 +1000,86 @@ def _check_footer_legal_links(snap: PageSnapshot, ctx: QAContext) -> CheckResult
 
 def _check_cache_headers(snap: PageSnapshot, ctx: QAContext) -> CheckResult:
     """Caching policies verified, CDN for static assets (DEV-039)."""
+    result = _result("cache_headers", "Caching & CDN")
     # Check the main document response for cache headers
     main_url = snap.final_url.rstrip("/")
-    doc_requests = [
-        r for r in snap.network_requests
-        if r.get("url", "").rstrip("/") == main_url and r.get("resource_type") == "document"
-    ]
-    # Check for CDN indicators in any request
-    cdn_indicators = ["cdn", "cloudfront", "cloudflare", "fastly", "akamai", "stackpath"]
-    has_cdn = any(
-        any(cdn in r.get("url", "").lower() for cdn in cdn_indicators)
-        for r in snap.network_requests
-    )
+    # One pass finds both the main document response and any CDN-served request
+    has_cdn = False
+    doc_request = None
+    for r, url_lower in zip(snap.network_requests, _page_stats(snap).request_urls_lower):
+        url = r.get("url", "")
+        if not has_cdn:
+            has_cdn = any(cdn in url_lower for cdn in _CDN_INDICATORS)
+        if doc_request is None and r.get("resource_type") == "document" and url.rstrip("/") == main_url:
+            doc_request = r
+        if has_cdn and doc_request is not None:
+            break
 
     evidence_parts = []
     if has_cdn:
         evidence_parts.append("CDN-served assets detected")
-    if doc_requests:
-        evidence_parts.append(f"Main document returned status {doc_requests[0].get('status', '?')}")
+    if doc_request is not None:
+        evidence_parts.append(f"Main document returned status {doc_request.get('status', '?')}")
 
     if has_cdn:
-        return CheckResult(
-            check_id="cache_headers",
-            name="Caching & CDN",
-            category="developer",
+        return result(
             status=CheckStatus.PASS,
             message=f"CDN detected for static asset delivery. {'; '.join(evidence_parts)}.",
         )
-    return CheckResult(
-        check_id="cache_headers",
-        name="Caching & CDN",
-        category="developer",
+    return result(
         status=CheckStatus.WARN,
         message="No CDN detected for static assets. Consider using a CDN for improved performance.",
         evidence="; ".join(evidence_parts) if evidence_parts else None,
     )
+
+
+# Checklist order; run() reads these rather than rebuilding the list per page
+_CHECKS = (
+    _check_correct_group,
+    _check_new_variant,
+    _check_fonts_match,
+    _check_images_match_design,
+    _check_image_formats,
+    _check_sticky_cta_mobile,
+    _check_sticky_cta_text,
+    _check_price_updates,
+    _check_copy_matches,
+    _check_cta_scroll_target,
+    _check_cta_hover_color,
+    _check_carousel_functioning,
+    _check_carousel_transition,
+    _check_form_fields,
+    _check_field_names_standard,
+    _check_form_id,
+    _check_placeholder_styling,
+    _check_form_validation,
+    _check_form_values_no_codes,
+    _check_lead_submission,
+    _check_sms_client_name,
+    _check_sms_verification,
+    _check_redirect_thankyou,
+    _check_thankyou_redirect,
+    _check_uli_parameters,
+    _check_ux_testing,
+    _check_page_titles,
+    _check_console_errors,
+    _check_unused_scripts,
+    _check_urls_no_variant,
+    _check_page_speed,
+    _check_gtm_present,
+    _check_image_compression,
+    _check_code_minification,
+    _check_server_compression,
+    _check_footer_legal_links,
+    _check_cache_headers,
+)
+
+
+# Checks whose result never depends on the page or context, built once at import
+_STATIC_RESULTS = {
+    fn: fn(None, None)
+    for fn in (_check_new_variant, _check_price_updates, _check_lead_submission, _check_thankyou_redirect)
+}
+_DYNAMIC_CHECKS = tuple(fn for fn in _CHECKS if fn not in _STATIC_RESULTS)
+# Display names for checks that raise, worked out once rather than per error
+_CHECK_NAMES = {fn: fn.__name__.replace("_check_", "").replace("_", " ").title() for fn in _CHECKS}
@@ -18,13 +18,23 @@ import asyncio
 import json
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-from qa_agent.config import QAContext, QAReport, OUTPUT_DIR
-from qa_agent.crawler import crawl_page
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from qa_agent.config import PageSnapshot, QAContext, QAReport, OUTPUT_DIR
+from qa_agent.crawler import SCREENSHOT_MODES, BrowserPool, crawl_page
 from qa_agent.checks import run_all
 from qa_agent.reporter import print_terminal, to_markdown, to_asana_comment
 
+# Fallback encoder when orjson isn't installed; one for every results file,
+# so batch runs don't build a new one per report
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
 
 def run_qa(
     url: str,
@@ -39,6 +49,8 @@ def run_qa(
     screenshots: bool = True,
     post_to_asana: bool = False,
     asana_task_id: str | None = None,
+    screenshot_mode: str = "full",
+    block_trackers: bool = False,
 ) -> QAReport:
     """
     Core QA run: crawl a page, run all checks, generate report.
@@ -57,11 +69,40 @@ def run_qa(
     )
 
     out_dir = output_dir or OUTPUT_DIR
+    snapshot = asyncio.run(_crawl_once(url, out_dir, screenshots, screenshot_mode, block_trackers))
+    return _check_and_report(snapshot, context, out_dir, post_to_asana)
+
+
+async def _crawl_once(url: str, out_dir: str, screenshots: bool = True,
+                      screenshot_mode: str = "full", block_trackers: bool = False) -> PageSnapshot:
+    """Crawl on this asyncio.run() loop, closing its browser before the loop ends."""
+    try:
+        return await _crawl(url, out_dir, screenshots, screenshot_mode, block_trackers)
+    finally:
+        await BrowserPool.shutdown()
+
+
+async def _crawl(url: str, out_dir: str, screenshots: bool = True,
+                 screenshot_mode: str = "full", block_trackers: bool = False) -> PageSnapshot:
+    """Crawl the page and print a one-line summary of what was captured."""
     print(f"\n🔍 Crawling {url} ...")
-    snapshot = asyncio.run(crawl_page(url, output_dir=out_dir, capture_screenshots=screenshots))
+    snapshot = await crawl_page(url, output_dir=out_dir, capture_screenshots=screenshots,
+                                screenshot_mode=screenshot_mode, block_trackers=block_trackers)
     print(f"   Page loaded in {snapshot.load_time_ms}ms | Status: {snapshot.status_code}")
     print(f"   Images: {len(snapshot.images)} | Forms: {len(snapshot.forms)} | "
           f"Scripts: {len(snapshot.scripts)} | Console errors: {len(snapshot.console_errors)}")
+    return snapshot
+
+
+def _check_and_report(
+    snapshot: PageSnapshot,
+    context: QAContext,
+    out_dir: str,
+    post_to_asana: bool = False,
+) -> QAReport:
+    """Run every check on a crawled page, then print, save and optionally post the report."""
+    url = context.landing_page_url
+    asana_task_id = context.asana_task_id
 
     print(f"\n🧪 Running checks ...")
     results = run_all(snapshot, context)
@@ -77,10 +118,12 @@ def run_qa(
     print(f"📄 Report saved: {md_path}")
 
     # Save JSON (machine-readable)
-    json_path = Path(out_dir) / f"qa_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    # One clock read so the filename and the recorded timestamp agree
+    now = datetime.now()
+    json_path = Path(out_dir) / f"qa_results_{now.strftime('%Y%m%d_%H%M%S')}.json"
     json_data = {
         "url": url,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         "summary": report.summary,
         "results": [
             {
@@ -94,7 +137,12 @@ def run_qa(
             for r in report.results
         ],
     }
-    json_path.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+    else:
+        # Streamed chunk by chunk so large evidence never sits in one giant string
+        with json_path.open("w", encoding="utf-8") as fp:
+            fp.writelines(_JSON_ENCODER.iterencode(json_data))
     print(f"📊 JSON results: {json_path}")
 
     # Post to Asana if requested
@@ -124,6 +172,8 @@ def cmd_run(args):
         screenshots=not args.no_screenshots,
         post_to_asana=args.post,
         asana_task_id=args.asana_task_id,
+        screenshot_mode=args.screenshot_mode,
+        block_trackers=args.block_trackers,
     )
 
     # Exit code based on failures
@@ -167,36 +217,55 @@ def cmd_asana(args):
 
 def cmd_batch(args):
     """Handle the 'batch' subcommand — run QA on all tasks in a section."""
-    from qa_agent.asana_client import get_qa_tasks, build_context_from_task
+    from qa_agent.asana_client import get_qa_tasks
 
     print(f"🔎 Finding tasks in section '{args.section}' of project {args.project_gid}...")
     tasks = get_qa_tasks(args.project_gid, args.section)
     print(f"   Found {len(tasks)} incomplete tasks.")
+    asyncio.run(_run_batch(tasks, args))
 
-    for i, task in enumerate(tasks, 1):
-        print(f"\n{'='*60}")
-        print(f"  Task {i}/{len(tasks)}: {task['name']}")
-        print(f"{'='*60}")
+
+async def _run_batch(tasks: list[dict], args) -> None:
+    """
+    Crawl up to args.concurrency tasks at once in one shared browser; each
+    page's checks and report run as soon as its crawl finishes.
+
+    Every task writes to its own subdirectory of the output dir so concurrent
+    runs never overwrite each other's screenshots or reports.
+    """
+    from qa_agent.asana_client import build_context_from_task
+
+    sem = asyncio.Semaphore(max(1, args.concurrency))
+
+    async def worker(i: int, task: dict) -> None:
         try:
-            ctx = build_context_from_task(task["gid"])
+            ctx = build_context_from_task(task)
             if not ctx.landing_page_url:
-                print(f"   ⏭️ No LP URL found, skipping.")
-                continue
-            run_qa(
-                url=ctx.landing_page_url,
-                client_name=ctx.client_name,
-                campaign_name=ctx.campaign_name,
-                figma_url=ctx.figma_url,
-                copy_doc_url=ctx.copy_doc_url,
-                asana_task_id=task["gid"],
-                output_dir=args.output,
-                post_to_asana=args.post,
-            )
+                print(f"\n⏭️ Task {i}/{len(tasks)}: {task['name']} — no LP URL found, skipping.")
+                return
+            out_dir = str(Path(args.output) / task["gid"])
+            async with sem:
+                print(f"\n{'='*60}")
+                print(f"  Task {i}/{len(tasks)}: {task['name']}")
+                print(f"{'='*60}")
+                snapshot = await _crawl(ctx.landing_page_url, out_dir, screenshot_mode=args.screenshot_mode,
+                                        block_trackers=args.block_trackers)
+            # The checks and the Asana post block, so they run on a worker thread
+            # while the loop keeps the other crawls moving; print_terminal writes
+            # each report in one call, so reports still don't interleave
+            await asyncio.to_thread(_check_and_report, snapshot, ctx, out_dir, post_to_asana=args.post)
         except Exception as e:
-            print(f"   ❌ Error: {e}")
+            print(f"   ❌ Task {i}/{len(tasks)} ({task['name']}) error: {e}")
+
+    try:
+        await asyncio.gather(*(worker(i, task) for i, task in enumerate(tasks, 1)))
+    finally:
+        await BrowserPool.shutdown()
 
 
-def main():
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """The CLI's argument parser, built once per process."""
     parser = argparse.ArgumentParser(
         description="🤖 Social Garden QA Checklist Agent",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -222,6 +291,11 @@ Examples:
     p_run.add_argument("--form-id", default="lp-pom-form-42", help="Expected form element ID")
     p_run.add_argument("--output", "-o", default=OUTPUT_DIR, help="Output directory")
     p_run.add_argument("--no-screenshots", action="store_true", help="Skip screenshot capture")
+    p_run.add_argument("--screenshot-mode", choices=SCREENSHOT_MODES, default="full",
+                       help="full-page PNG, full-page JPEG, or viewport-only PNG (default: full)")
+    p_run.add_argument("--block-trackers", action="store_true",
+                       help="Block ad/analytics requests and media for a faster crawl "
+                            "(GTM and page-speed results then no longer reflect the live page)")
     p_run.add_argument("--post", action="store_true", help="Post results back to Asana")
     p_run.add_argument("--asana-task-id", help="Asana task GID to post results to")
     p_run.set_defaults(func=cmd_run)
@@ -243,9 +317,20 @@ Examples:
     p_batch.add_argument("--section", default="QA", help="Section name to scan (default: QA)")
     p_batch.add_argument("--post", action="store_true", help="Post results back to Asana")
     p_batch.add_argument("--output", "-o", default=OUTPUT_DIR, help="Output directory")
+    p_batch.add_argument("--concurrency", "-j", type=int, default=4,
+                         help="Pages to crawl at once (default: 4)")
+    p_batch.add_argument("--screenshot-mode", choices=SCREENSHOT_MODES, default="full",
+                         help="full-page PNG, full-page JPEG, or viewport-only PNG (default: full)")
+    p_batch.add_argument("--block-trackers", action="store_true",
+                         help="Block ad/analytics requests and media for a faster crawl "
+                              "(GTM and page-speed results then no longer reflect the live page)")
     p_batch.set_defaults(func=cmd_batch)
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = _build_parser().parse_args(argv)
     args.func(args)
 
 
@@ -4,7 +4,7 @@ qa_agent/config.py — Configuration and data models for the QA agent.
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 import os
 
 
@@ -15,9 +15,9 @@ class CheckStatus(Enum):
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CheckResult:
-    """Result of a single QA check."""
+    """Result of a single QA check. Frozen: the same instance may appear in many reports."""
     check_id: str
     name: str
     category: str          # "developer" | "designer" | "copywriter"
@@ -27,7 +27,7 @@ class CheckResult:
     screenshot: Optional[str] = None # path to screenshot if captured
 
 
-@dataclass
+@dataclass(slots=True)
 class PageSnapshot:
     """Everything we extract from a single page crawl."""
     url: str
@@ -52,9 +52,23 @@ class PageSnapshot:
     redirect_chain: list[str] = field(default_factory=list)
     page_size_bytes: int = 0
     load_time_ms: int = 0
-
-
-@dataclass
+    flags: dict[str, bool] = field(default_factory=dict)  # is_unbounce, has_placeholder_css (from the browser)
+    cta_transition_stats: Optional[dict] = None  # {cta_count, transition_count}
+    inline_css_stats: Optional[dict] = None      # {chars, newlines} across <style> blocks
+    gtm_container_ids: Optional[list[str]] = None  # first few GTM-XXXX IDs in the markup
+    # Derived views (visible text, headings, ...) shared across checks
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return a derived view of this snapshot, computing it on first use."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = compute()
+            return value
+
+
+@dataclass(slots=True)
 class QAContext:
     """Context passed to the QA run — what we know about this task."""
     landing_page_url: str
@@ -68,47 +82,82 @@ class QAContext:
     thank_you_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QAReport:
     """Full QA report across all check categories."""
     context: QAContext
-    results: list[CheckResult]
+    # Stored as a tuple: it can only change by assigning report.results, which
+    # is what drops the memoised summary and status groups below
+    results: tuple[CheckResult, ...]
     summary: dict = field(default_factory=dict)  # populated after run
 
+    # Results grouped by status, built on first use. slots=True rules out
+    # functools.cached_property, so the groups are memoised here instead.
+    _by_status: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _summary_built: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name == "results":
+            value = tuple(value)
+            object.__setattr__(self, "_by_status", None)
+            object.__setattr__(self, "_summary_built", False)
+        object.__setattr__(self, name, value)
+
+    def _with_status(self, status: CheckStatus) -> tuple[CheckResult, ...]:
+        if self._by_status is None:
+            groups = {s: [] for s in CheckStatus}
+            for r in self.results:
+                groups[r.status].append(r)
+            self._by_status = {s: tuple(rs) for s, rs in groups.items()}
+        return self._by_status[status]
+
     @property
-    def passed(self) -> list[CheckResult]:
-        return [r for r in self.results if r.status == CheckStatus.PASS]
+    def passed(self) -> tuple[CheckResult, ...]:
+        return self._with_status(CheckStatus.PASS)
 
     @property
-    def failed(self) -> list[CheckResult]:
-        return [r for r in self.results if r.status == CheckStatus.FAIL]
+    def failed(self) -> tuple[CheckResult, ...]:
+        return self._with_status(CheckStatus.FAIL)
 
     @property
-    def warnings(self) -> list[CheckResult]:
-        return [r for r in self.results if r.status == CheckStatus.WARN]
+    def warnings(self) -> tuple[CheckResult, ...]:
+        return self._with_status(CheckStatus.WARN)
 
     @property
-    def skipped(self) -> list[CheckResult]:
-        return [r for r in self.results if r.status == CheckStatus.SKIP]
+    def skipped(self) -> tuple[CheckResult, ...]:
+        return self._with_status(CheckStatus.SKIP)
 
     def build_summary(self):
+        # The terminal, markdown and Asana reporters each call this; only the
+        # first call does any work until report.results is reassigned
+        if self._summary_built:
+            return
+        # Single pass over the results for both the status and per-category tallies
+        counts = {status: 0 for status in CheckStatus}
+        by_category = {}
+        for r in self.results:
+            counts[r.status] += 1
+            cat = by_category.setdefault(r.category, {"total": 0, "passed": 0, "failed": 0})
+            cat["total"] += 1
+            if r.status == CheckStatus.PASS:
+                cat["passed"] += 1
+            elif r.status == CheckStatus.FAIL:
+                cat["failed"] += 1
+
+        total = len(self.results)
+        passed = counts[CheckStatus.PASS]
+        pass_rate_pct = passed / total * 100 if total else 0.0
         self.summary = {
-            "total": len(self.results),
-            "passed": len(self.passed),
-            "failed": len(self.failed),
-            "warnings": len(self.warnings),
-            "skipped": len(self.skipped),
-            "pass_rate": f"{len(self.passed)/len(self.results)*100:.0f}%" if self.results else "N/A",
-            "by_category": {},
+            "total": total,
+            "passed": passed,
+            "failed": counts[CheckStatus.FAIL],
+            "warnings": counts[CheckStatus.WARN],
+            "skipped": counts[CheckStatus.SKIP],
+            "pass_rate": f"{pass_rate_pct:.0f}%" if total else "N/A",
+            "pass_rate_pct": pass_rate_pct,
+            "by_category": {cat: by_category[cat] for cat in sorted(by_category)},
         }
-        cats = set(r.category for r in self.results)
-        for cat in sorted(cats):
-            cat_results = [r for r in self.results if r.category == cat]
-            self.summary["by_category"][cat] = {
-                "total": len(cat_results),
-                "passed": sum(1 for r in cat_results if r.status == CheckStatus.PASS),
-                "failed": sum(1 for r in cat_results if r.status == CheckStatus.FAIL),
-            }
+        self._summary_built = True
 
 
 # ── Settings ──
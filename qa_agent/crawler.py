@@ -7,13 +7,19 @@ forms, links, scripts, and compression headers for QA validation.
 from __future__ import annotations
 
 import asyncio
+import atexit
 import json
 import os
+import threading
 import time
+import weakref
+from urllib.parse import urlsplit
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
-from playwright.async_api import async_playwright, Page, BrowserContext, Response
+from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from qa_agent.config import PageSnapshot, OUTPUT_DIR
 
@@ -25,13 +31,97 @@ MOBILE_UA = (
     "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
 )
 NAVIGATION_TIMEOUT = 30_000  # ms
-WAIT_AFTER_LOAD = 2_000  # ms — let JS settle
+NETWORK_IDLE_TIMEOUT = 5_000  # ms — pages with long-polling scripts never go idle
 
+# Ad/analytics hosts (and their subdomains) dropped when a crawl blocks trackers
+BLOCKED_HOSTS = frozenset([
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com",
+    "google-analytics.com", "googletagmanager.com", "facebook.net",
+    "analytics.tiktok.com", "hotjar.com", "clarity.ms",
+    "bat.bing.com", "snap.licdn.com",
+])
+BLOCKED_RESOURCE_TYPES = frozenset(["media"])
 
-async def _extract_page_data(page: Page, viewport_label: str) -> dict:
-    """Extract structured data from the current page state."""
 
-    data = await page.evaluate("""() => {
+def _is_blocked_host(host: str) -> bool:
+    parts = host.split(".")
+    # a.b.facebook.net is tested as itself, b.facebook.net and facebook.net
+    return any(".".join(parts[i:]) in BLOCKED_HOSTS for i in range(len(parts) - 1))
+
+
+async def _block_trackers(route) -> None:
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(urlsplit(request.url).hostname or ""):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+ScreenshotMode = Literal["full", "jpeg", "viewport"]
+# mode -> (file extension, page.screenshot options)
+SCREENSHOT_MODES: dict[str, tuple[str, dict]] = {
+    "full": ("png", {"full_page": True}),
+    # Full page at a fraction of the PNG size, for long pages and batch runs
+    "jpeg": ("jpg", {"full_page": True, "type": "jpeg", "quality": 70}),
+    # Above-the-fold only: no off-screen paint at all
+    "viewport": ("png", {"full_page": False}),
+}
+
+
+@dataclass(slots=True)
+class _PoolState:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    playwright: Optional[Playwright] = None
+    browser: Optional[Browser] = None
+
+
+class BrowserPool:
+    """
+    One warm headless Chromium per event loop, shared by every crawl on it.
+
+    Crawls only open and close their own contexts, so repeated crawls skip the
+    browser launch. Playwright objects belong to the loop that started them,
+    hence one browser per loop; call shutdown() before that loop ends.
+    """
+    _states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _PoolState]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    async def get_browser(cls) -> Browser:
+        """The running loop's browser, launched (or relaunched after a crash) on demand."""
+        loop = asyncio.get_running_loop()
+        state = cls._states.get(loop)
+        if state is None:
+            state = cls._states[loop] = _PoolState()
+        async with state.lock:
+            if state.browser is None or not state.browser.is_connected():
+                if state.playwright is None:
+                    state.playwright = await async_playwright().start()
+                state.browser = await state.playwright.chromium.launch(headless=True)
+            return state.browser
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the running loop's browser and Playwright driver, if any."""
+        state = cls._states.pop(asyncio.get_running_loop(), None)
+        if state is None:
+            return
+        async with state.lock:
+            if state.browser is not None:
+                await state.browser.close()
+            if state.playwright is not None:
+                await state.playwright.stop()
+
+
+async def _extract_page_data(page: Page, viewport_label: str, include_html: bool = True) -> dict:
+    """
+    Extract structured data from the current page state.
+
+    The serialised DOM is the largest thing sent back from the browser, so
+    include_html=False leaves it (and the GTM scan over it) out when the
+    caller has no use for it.
+    """
+
+    data = await page.evaluate("""(includeHtml) => {
         const result = {};
 
         // Title + meta
@@ -40,65 +130,92 @@ async def _extract_page_data(page: Page, viewport_label: str) -> dict:
             || document.querySelector('meta[name="title"]');
         result.meta_title = metaTitle ? metaTitle.getAttribute('content') || '' : '';
 
-        // Fonts — get computed font families from visible elements
+        // Everything else comes from one walk over the element tree: each element
+        // is tested against every bucket's selector, and its computed style is
+        // read once and shared by the fonts, sticky and CTA-transition checks
+        const FONT_TAGS = new Set(['h1', 'h2', 'h3', 'h4', 'p', 'a', 'span', 'li', 'button', 'label', 'input']);
+        const LINK_SEL = 'a, [onclick], [role="link"]';
+        // CTA buttons — anything that looks like a call-to-action
+        const CTA_SEL = 'button, a.btn, a.cta, [class*="cta"], [class*="button"], input[type="submit"]';
+        // CTAs whose hover transitions are counted (no a.cta, as before); a
+        // subset of CTA_SEL, so it's only tested on elements that matched that
+        const CTA_HOVER_SEL = 'button, a.btn, [class*="cta"], [class*="button"], input[type="submit"]';
+        const CAROUSEL_SEL = '[class*="carousel"], [class*="slider"], [class*="swiper"], [class*="slick"]';
+        const LOGO_SEL = '[class*="logo"] a, a [class*="logo"], header a:first-child';
+
         const fontSet = new Set();
-        document.querySelectorAll('h1,h2,h3,h4,p,a,span,li,button,label,input').forEach(el => {
-            const ff = getComputedStyle(el).fontFamily;
-            if (ff) ff.split(',').forEach(f => fontSet.add(f.trim().replace(/['"]/g, '')));
-        });
-        result.fonts = [...fontSet];
+        const seenFontStacks = new Set();  // most elements share a handful of stacks
+        const images = {src: [], dataSrc: [], alt: [], width: [], height: [], naturalWidth: [], naturalHeight: []};
+        const links = [], forms = [], scripts = [], stickyEls = [];
+        const ctaButtons = [], carousels = [], styleTexts = [];
+        let ctaCount = 0, transitionCount = 0;
+        let logo = null;
+
+        const walker = document.createTreeWalker(document.documentElement, NodeFilter.SHOW_ELEMENT);
+        for (let el = walker.currentNode; el; el = walker.nextNode()) {
+            // localName, like a type selector, also matches SVG <a>/<script>/<style>
+            const name = el.localName;
+            const tag = el.tagName.toLowerCase();
+            const style = getComputedStyle(el);
+
+            // Fonts — computed font families from text elements
+            if (FONT_TAGS.has(name)) {
+                const ff = style.fontFamily;
+                if (ff && !seenFontStacks.has(ff)) {
+                    seenFontStacks.add(ff);
+                    ff.split(',').forEach(f => fontSet.add(f.trim().replace(/['"]/g, '')));
+                }
+            }
+
+            if (name === 'img') {
+                // Column per field; _image_rows() rebuilds the dicts in Python
+                images.src.push(el.src || '');
+                images.dataSrc.push(el.src ? '' : (el.dataset.src || ''));
+                images.alt.push(el.alt || '');
+                images.width.push(el.width);
+                images.height.push(el.height);
+                images.naturalWidth.push(el.naturalWidth);
+                images.naturalHeight.push(el.naturalHeight);
+            } else if (name === 'form') {
+                forms.push({
+                    id: el.id || '',
+                    action: el.action || '',
+                    method: el.method || '',
+                    fields: [...el.querySelectorAll('input,select,textarea')].map(f => ({
+                        name: f.name || '',
+                        type: f.type || f.tagName.toLowerCase(),
+                        id: f.id || '',
+                        placeholder: f.placeholder || '',
+                        required: f.required,
+                        value: f.value || '',
+                        label: f.labels?.[0]?.textContent?.trim() || '',
+                    })),
+                });
+            } else if (name === 'script') {
+                scripts.push({
+                    src: el.src || '',
+                    inline_length: el.src ? 0 : (el.textContent || '').length,
+                });
+            } else if (name === 'style') {
+                styleTexts.push(el.textContent || '');
+            }
 
-        // Images
-        result.images = [...document.querySelectorAll('img')].map(img => ({
-            src: img.src || img.dataset.src || '',
-            alt: img.alt || '',
-            width: img.width,
-            height: img.height,
-            naturalWidth: img.naturalWidth,
-            naturalHeight: img.naturalHeight,
-            format: (img.src || '').split('?')[0].split('.').pop().toLowerCase(),
-            hasTransparency: (img.src || '').toLowerCase().endsWith('.png'),
-        }));
-
-        // Links
-        result.links = [...document.querySelectorAll('a, [onclick], [role="link"]')].map(el => ({
-            href: el.href || el.getAttribute('onclick') || '',
-            text: (el.textContent || '').trim().substring(0, 200),
-            target: el.target || '',
-            tag: el.tagName.toLowerCase(),
-        }));
-
-        // Forms
-        result.forms = [...document.querySelectorAll('form')].map(form => ({
-            id: form.id || '',
-            action: form.action || '',
-            method: form.method || '',
-            fields: [...form.querySelectorAll('input,select,textarea')].map(f => ({
-                name: f.name || '',
-                type: f.type || f.tagName.toLowerCase(),
-                id: f.id || '',
-                placeholder: f.placeholder || '',
-                required: f.required,
-                value: f.value || '',
-                label: f.labels?.[0]?.textContent?.trim() || '',
-            })),
-        }));
-
-        // Scripts
-        result.scripts = [...document.querySelectorAll('script')].map(s => ({
-            src: s.src || '',
-            inline_length: s.src ? 0 : (s.textContent || '').length,
-        }));
-
-        // Sticky / fixed positioned elements (CTA bars)
-        const stickyEls = [];
-        document.querySelectorAll('*').forEach(el => {
-            const pos = getComputedStyle(el).position;
+            if (el.matches(LINK_SEL)) {
+                links.push({
+                    href: el.href || el.getAttribute('onclick') || '',
+                    text: (el.textContent || '').trim().substring(0, 200),
+                    target: el.target || '',
+                    tag: tag,
+                });
+            }
+
+            // Sticky / fixed positioned elements (CTA bars)
+            const pos = style.position;
             if (pos === 'fixed' || pos === 'sticky') {
                 const text = (el.textContent || '').trim().substring(0, 200);
                 if (text.length > 0 && text.length < 500) {
                     stickyEls.push({
-                        tag: el.tagName.toLowerCase(),
+                        tag: tag,
                         id: el.id || '',
                         classes: el.className || '',
                         text: text,
@@ -106,80 +223,283 @@ async def _extract_page_data(page: Page, viewport_label: str) -> dict:
                     });
                 }
             }
-        });
-        result.sticky_elements = stickyEls;
 
-        // CTA buttons — anything that looks like a call-to-action
-        result.cta_buttons = [...document.querySelectorAll(
-            'button, a.btn, a.cta, [class*="cta"], [class*="button"], input[type="submit"]'
-        )].map(el => ({
-            text: (el.textContent || el.value || '').trim().substring(0, 200),
-            tag: el.tagName.toLowerCase(),
-            href: el.href || '',
-            type: el.type || '',
-        }));
-
-        // Carousel detection
-        result.carousels = [...document.querySelectorAll(
-            '[class*="carousel"], [class*="slider"], [class*="swiper"], [class*="slick"]'
-        )].map(el => ({
-            classes: el.className,
-            childCount: el.children.length,
-            hasAutoplay: el.getAttribute('data-autoplay') || el.getAttribute('data-auto') || '',
-        }));
-
-        // Check for hover color changes on CTA buttons
-        // (We can't fully test hover in extraction, but we check if CSS transitions exist)
-        result.cta_has_transitions = [...document.querySelectorAll(
-            'button, a.btn, [class*="cta"], [class*="button"], input[type="submit"]'
-        )].some(el => {
-            const t = getComputedStyle(el).transition;
-            return t && t !== 'all 0s ease 0s' && t !== 'none';
-        });
+            const isCta = el.matches(CTA_SEL);
+            if (isCta) {
+                ctaButtons.push({
+                    text: (el.textContent || el.value || '').trim().substring(0, 200),
+                    tag: tag,
+                    href: el.href || '',
+                    type: el.type || '',
+                });
+            }
+
+            // Hover color changes on CTA buttons: we can't fully test hover
+            // in extraction, but we count CTAs with CSS transitions
+            if (isCta && el.matches(CTA_HOVER_SEL)) {
+                ctaCount++;
+                const t = style.transition;
+                if (t && t !== 'all 0s ease 0s' && t !== 'none') transitionCount++;
+            }
+
+            if (el.matches(CAROUSEL_SEL)) {
+                carousels.push({
+                    classes: el.className,
+                    childCount: el.children.length,
+                    hasAutoplay: el.getAttribute('data-autoplay') || el.getAttribute('data-auto') || '',
+                });
+            }
+
+            if (logo === null && el.matches(LOGO_SEL)) logo = el;
+        }
+
+        result.fonts = [...fontSet];
+        result.images = images;
+        result.links = links;
+        result.forms = forms;
+        result.scripts = scripts;
+        result.sticky_elements = stickyEls;
+        result.cta_buttons = ctaButtons;
+        result.carousels = carousels;
+        result.cta_transition_stats = {cta_count: ctaCount, transition_count: transitionCount};
 
         // Logo link check
-        const logo = document.querySelector('[class*="logo"] a, a [class*="logo"], header a:first-child');
         result.logo_link = logo ? (logo.href || logo.closest('a')?.href || '') : null;
 
+        // Inline CSS size, read from the parsed <style> elements
+        result.inline_css_stats = {
+            chars: styleTexts.reduce((n, t) => n + t.length, 0),
+            newlines: styleTexts.reduce((n, t) => n + t.split('\\n').length - 1, 0),
+        };
+
+        // Page-level flags, answered from the live DOM/CSSOM so checks don't
+        // have to sniff the raw HTML for them
+        result.flags = {};
+
+        // ::placeholder rules, including ones nested in @media/@supports/@layer
+        // and @import-ed sheets. A cross-origin sheet's rules can't be read, so
+        // unless a rule turned up elsewhere the flag is left unset and the
+        // check falls back to scanning the HTML
+        const hasPlaceholderRule = rules => [...rules].some(r =>
+            (r.selectorText || '').includes('placeholder')
+            || (r.cssRules ? hasPlaceholderRule(r.cssRules) : false)
+            || (r.styleSheet ? hasPlaceholderRule(r.styleSheet.cssRules) : false));
+        let placeholderCss = false, unreadableSheet = false;
+        for (const sheet of document.styleSheets) {
+            try {
+                if (hasPlaceholderRule(sheet.cssRules)) {
+                    placeholderCss = true;
+                    break;
+                }
+            } catch (e) {
+                unreadableSheet = true;
+            }
+        }
+        if (placeholderCss || !unreadableSheet) result.flags.has_placeholder_css = placeholderCss;
+
         // Full HTML for deeper checks
-        result.dom_html = document.documentElement.outerHTML;
+        if (includeHtml) {
+            result.dom_html = document.documentElement.outerHTML;
+            // Scanned here while the string is in hand, so Python doesn't regex it again
+            result.gtm_container_ids = (result.dom_html.match(/GTM-[A-Z0-9]{4,}/g) || []).slice(0, 3);
+            // Same test as the HTML fallback: "unbounce" anywhere in the markup
+            // (inline scripts, comments, data-* attributes) or in a script URL
+            result.flags.is_unbounce = result.dom_html.toLowerCase().includes('unbounce')
+                || scripts.some(s => s.src.toLowerCase().includes('unbounce'));
+        }
 
         return result;
-    }""")
+    }""", include_html)
 
+    data["images"] = _image_rows(data["images"])
     return data
 
 
-async def _capture_network(page: Page) -> tuple[list[dict], str | None]:
-    """Returns (network_requests, compression_type)."""
-    requests = []
-    compression = None
-
-    def on_response(response: Response):
-        nonlocal compression
-        headers = response.headers
-        if response.url == page.url:
-            enc = headers.get("content-encoding", "")
-            if "br" in enc:
-                compression = "br"
-            elif "gzip" in enc:
-                compression = "gzip"
-
-        requests.append({
-            "url": response.url,
-            "status": response.status,
-            "resource_type": response.request.resource_type,
-            "size": int(headers.get("content-length", 0)),
+def _image_rows(cols: dict[str, list]) -> list[dict]:
+    """
+    Rebuild per-image dicts from the columns the extraction script returns.
+
+    Images come back as one array per field rather than one object per <img>,
+    which keeps the evaluate payload small on image-heavy pages. format and
+    hasTransparency are derived from the src attribute here; lazy-loaded
+    images (data-src only) keep an empty format, as before. The script fills
+    every column together; if they ever differ in length, rows stop at the
+    shortest one rather than pairing fields from different images.
+    """
+    images = []
+    for src, data_src, alt, width, height, natural_width, natural_height in zip(
+        cols["src"], cols["dataSrc"], cols["alt"], cols["width"], cols["height"],
+        cols["naturalWidth"], cols["naturalHeight"],
+    ):
+        images.append({
+            "src": src or data_src,
+            "alt": alt,
+            "width": width,
+            "height": height,
+            "naturalWidth": natural_width,
+            "naturalHeight": natural_height,
+            "format": src.partition("?")[0].rpartition(".")[2].lower(),
+            "hasTransparency": src.lower().endswith(".png"),
         })
+    return images
+
+
+@dataclass(slots=True)
+class _ViewportCrawl:
+    """What one viewport's visit to the page produced."""
+    data: dict                    # _extract_page_data output
+    screenshot: Optional[str]
+    status_code: int = 0
+    final_url: str = ""
+    load_time_ms: int = 0
+    console_errors: list[dict] = field(default_factory=list)
+    console_warnings: list[dict] = field(default_factory=list)
+    network_requests: list[dict] = field(default_factory=list)
+    transfer_bytes: int = 0       # running sum of the network_requests sizes
+    compression: Optional[str] = None
+    redirect_chain: list[str] = field(default_factory=list)
+
+
+async def _crawl_viewport(
+    browser: Browser,
+    url: str,
+    label: str,
+    screenshot_path: Optional[str],
+    screenshot_options: Optional[dict] = None,
+    record_activity: bool = False,
+    include_html: bool = False,
+    block_trackers: bool = False,
+    navigated: Optional[asyncio.Event] = None,
+    **context_options,
+) -> _ViewportCrawl:
+    """
+    Load the page in a fresh context of the shared browser and extract it.
+
+    With record_activity, console output, network responses and the redirect
+    chain are collected too; include_html adds the serialised DOM.
+    block_trackers aborts requests to BLOCKED_HOSTS and media downloads. `navigated`, if given, is set once the page has
+    loaded (or failed to), so another crawl can wait for it.
+    """
+    context = await browser.new_context(ignore_https_errors=True, **context_options)
+    try:
+        if block_trackers:
+            await context.route("**/*", _block_trackers)
+        page = await context.new_page()
+        crawl = _ViewportCrawl(data={}, screenshot=None)
+
+        if record_activity:
+            def on_console(msg):
+                entry = {
+                    "type": msg.type,
+                    "text": msg.text,
+                    "url": msg.location.get("url", "") if msg.location else "",
+                    "line": msg.location.get("lineNumber", 0) if msg.location else 0,
+                }
+                if msg.type == "error":
+                    crawl.console_errors.append(entry)
+                elif msg.type == "warning":
+                    crawl.console_warnings.append(entry)
+
+            page.on("console", on_console)
+
+            # Responses come straight off the DevTools protocol: the event already
+            # carries url, status, type and headers, without Playwright wrapping
+            # a Response (and its Request) for every subresource
+
+            # The document's own response: the crawled URL plus any trailing
+            # slashes. startswith() turns most subresources away without
+            # copying their URLs the way rstrip() did
+            page_key = url.rstrip("/")
+            # Redirect hops don't fire responseReceived, so the first match is
+            # the document; after it, responses skip the URL test altogether
+            document_seen = False
+
+            def on_response_received(event):
+                nonlocal document_seen
+                try:
+                    response = event["response"]
+                    headers = {k.lower(): v for k, v in response.get("headers", {}).items()}
+                    response_url = response["url"]
+                    if (not document_seen and response_url.startswith(page_key)
+                            and not response_url[len(page_key):].strip("/")):
+                        document_seen = True
+                        enc = headers.get("content-encoding", "")
+                        if "br" in enc:
+                            crawl.compression = "br"
+                        elif "gzip" in enc:
+                            crawl.compression = "gzip"
+                    size = int(headers.get("content-length", "0") or "0")
+                    crawl.network_requests.append({
+                        "url": response["url"],
+                        "status": response["status"],
+                        "resource_type": event.get("type", "Other").lower(),
+                        "size": size,
+                    })
+                    crawl.transfer_bytes += size
+                except Exception:
+                    pass
+
+            cdp = await context.new_cdp_session(page)
+            cdp.on("Network.responseReceived", on_response_received)
+            await cdp.send("Network.enable")
+
+            def on_request(request):
+                if request.is_navigation_request():
+                    crawl.redirect_chain.append(request.url)
+
+            page.on("request", on_request)
+
+        # Navigate
+        try:
+            t0 = time.time()
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT)
+            # Let late scripts and lazy assets settle, but only for so long
+            try:
+                await page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT)
+            except PlaywrightTimeoutError:
+                pass
+            crawl.load_time_ms = int((time.time() - t0) * 1000)
+        finally:
+            if navigated is not None:
+                navigated.set()
+
+        crawl.status_code = response.status if response else 0
+        crawl.final_url = page.url
+
+        # Extract DOM data
+        crawl.data = await _extract_page_data(page, label, include_html)
+
+        if screenshot_path:
+            await page.screenshot(path=screenshot_path, **(screenshot_options or SCREENSHOT_MODES["full"][1]))
+            crawl.screenshot = screenshot_path
+        return crawl
+    finally:
+        # The pooled browser outlives this crawl, so always release the context
+        await context.close()
 
-    page.on("response", on_response)
-    return requests, compression
+
+async def _crawl_mobile(browser: Browser, url: str, screenshot_path: Optional[str],
+                        screenshot_options: dict, block_trackers: bool,
+                        desktop_navigated: asyncio.Event) -> _ViewportCrawl:
+    # Start navigating once the desktop page has loaded: its extraction and
+    # screenshot overlap this load, while the desktop load time (reported by
+    # the page-speed check) is measured without a second page competing
+    await desktop_navigated.wait()
+    return await _crawl_viewport(
+        browser, url, "mobile", screenshot_path, screenshot_options,
+        block_trackers=block_trackers,
+        viewport=MOBILE_VIEWPORT,
+        user_agent=MOBILE_UA,
+        is_mobile=True,
+    )
 
 
 async def crawl_page(
     url: str,
     output_dir: Optional[str] = None,
     capture_screenshots: bool = True,
+    screenshot_mode: ScreenshotMode = "full",
+    block_trackers: bool = False,
 ) -> PageSnapshot:
     """
     Crawl a landing page and extract everything needed for QA checks.
@@ -188,126 +508,61 @@ async def crawl_page(
         url: The landing page URL to crawl.
         output_dir: Where to save screenshots (defaults to QA_OUTPUT_DIR).
         capture_screenshots: Whether to capture desktop/mobile screenshots.
+        screenshot_mode: "full" (full-page PNG), "jpeg" (full-page JPEG) or
+            "viewport" (above-the-fold PNG).
+        block_trackers: Abort ad/analytics requests and media downloads so the
+            page settles sooner. Off by default: the GTM, console and
+            page-speed checks need to see the page as visitors get it.
 
     Returns:
         PageSnapshot with all extracted data.
     """
+    if screenshot_mode not in SCREENSHOT_MODES:
+        raise ValueError(f"Unknown screenshot_mode {screenshot_mode!r}. Use one of: {', '.join(SCREENSHOT_MODES)}")
+    ext, screenshot_options = SCREENSHOT_MODES[screenshot_mode]
     out = Path(output_dir or OUTPUT_DIR)
     out.mkdir(parents=True, exist_ok=True)
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-
-        # ── Desktop crawl ──
-        context = await browser.new_context(
-            viewport=DESKTOP_VIEWPORT,
-            ignore_https_errors=True,
-        )
-        page = await context.new_page()
-
-        # Collect console messages
-        console_errors = []
-        console_warnings = []
-
-        def on_console(msg):
-            entry = {
-                "type": msg.type,
-                "text": msg.text,
-                "url": msg.location.get("url", "") if msg.location else "",
-                "line": msg.location.get("lineNumber", 0) if msg.location else 0,
-            }
-            if msg.type == "error":
-                console_errors.append(entry)
-            elif msg.type == "warning":
-                console_warnings.append(entry)
-
-        page.on("console", on_console)
-
-        # Collect network
-        network_requests = []
-        compression = None
-
-        async def on_response(response):
-            nonlocal compression
-            try:
-                headers = response.headers
-                if response.url.rstrip("/") == url.rstrip("/"):
-                    enc = headers.get("content-encoding", "")
-                    if "br" in enc:
-                        compression = "br"
-                    elif "gzip" in enc:
-                        compression = "gzip"
-                network_requests.append({
-                    "url": response.url,
-                    "status": response.status,
-                    "resource_type": response.request.resource_type,
-                    "size": int(headers.get("content-length", "0") or "0"),
-                })
-            except Exception:
-                pass
-
-        page.on("response", on_response)
-
-        # Navigate
-        t0 = time.time()
-        redirect_chain = []
-
-        def on_request(request):
-            if request.is_navigation_request():
-                redirect_chain.append(request.url)
-
-        page.on("request", on_request)
-
-        response = await page.goto(url, wait_until="networkidle", timeout=NAVIGATION_TIMEOUT)
-        await page.wait_for_timeout(WAIT_AFTER_LOAD)
-        load_time_ms = int((time.time() - t0) * 1000)
-
-        status_code = response.status if response else 0
-        final_url = page.url
-
-        # Extract DOM data (desktop)
-        desktop_data = await _extract_page_data(page, "desktop")
-
-        # Screenshot desktop
-        ss_desktop = None
-        if capture_screenshots:
-            ss_desktop = str(out / "screenshot_desktop.png")
-            await page.screenshot(path=ss_desktop, full_page=True)
-
-        await context.close()
-
-        # ── Mobile crawl ──
-        mobile_context = await browser.new_context(
-            viewport=MOBILE_VIEWPORT,
-            user_agent=MOBILE_UA,
-            is_mobile=True,
-            ignore_https_errors=True,
-        )
-        mobile_page = await mobile_context.new_page()
-        await mobile_page.goto(url, wait_until="networkidle", timeout=NAVIGATION_TIMEOUT)
-        await mobile_page.wait_for_timeout(WAIT_AFTER_LOAD)
-
-        mobile_data = await _extract_page_data(mobile_page, "mobile")
-
-        ss_mobile = None
-        if capture_screenshots:
-            ss_mobile = str(out / "screenshot_mobile.png")
-            await mobile_page.screenshot(path=ss_mobile, full_page=True)
-
-        await mobile_context.close()
-        await browser.close()
-
-    # Estimate page size from network
-    page_size = sum(r.get("size", 0) for r in network_requests)
+    browser = await BrowserPool.get_browser()
+
+    # Desktop and mobile run side by side in their own contexts of the browser
+    desktop_navigated = asyncio.Event()
+    desktop_task = asyncio.ensure_future(_crawl_viewport(
+        browser, url, "desktop",
+        str(out / f"screenshot_desktop.{ext}") if capture_screenshots else None,
+        screenshot_options,
+        record_activity=True,
+        include_html=True,
+        block_trackers=block_trackers,
+        navigated=desktop_navigated,
+        viewport=DESKTOP_VIEWPORT,
+    ))
+    mobile_task = asyncio.ensure_future(_crawl_mobile(
+        browser, url,
+        str(out / f"screenshot_mobile.{ext}") if capture_screenshots else None,
+        screenshot_options,
+        block_trackers,
+        desktop_navigated,
+    ))
+    try:
+        desktop, mobile = await asyncio.gather(desktop_task, mobile_task)
+    except BaseException:
+        # Don't leave the other viewport's page loading in the shared browser
+        for task in (desktop_task, mobile_task):
+            task.cancel()
+        await asyncio.gather(desktop_task, mobile_task, return_exceptions=True)
+        raise
+    desktop_data, mobile_data = desktop.data, mobile.data
+    network_requests = desktop.network_requests
 
     return PageSnapshot(
         url=url,
-        final_url=final_url,
+        final_url=desktop.final_url,
         title=desktop_data["title"],
         meta_title=desktop_data["meta_title"],
-        status_code=status_code,
-        console_errors=console_errors,
-        console_warnings=console_warnings,
+        status_code=desktop.status_code,
+        console_errors=desktop.console_errors,
+        console_warnings=desktop.console_warnings,
         network_requests=network_requests,
         fonts_loaded=desktop_data["fonts"],
         images=desktop_data["images"],
@@ -324,15 +579,83 @@ async def crawl_page(
             "links": mobile_data["links"],
             "fonts": mobile_data["fonts"],
         },
-        compression=compression,
-        screenshot_desktop=ss_desktop,
-        screenshot_mobile=ss_mobile,
-        redirect_chain=redirect_chain,
-        page_size_bytes=page_size,
-        load_time_ms=load_time_ms,
+        compression=desktop.compression,
+        screenshot_desktop=desktop.screenshot,
+        screenshot_mobile=mobile.screenshot,
+        redirect_chain=desktop.redirect_chain,
+        page_size_bytes=desktop.transfer_bytes,  # page size estimated from the network
+        load_time_ms=desktop.load_time_ms,
+        flags=desktop_data["flags"],
+        cta_transition_stats=desktop_data["cta_transition_stats"],
+        inline_css_stats=desktop_data["inline_css_stats"],
+        gtm_container_ids=desktop_data["gtm_container_ids"],
     )
 
 
-def crawl_sync(url: str, output_dir: str | None = None, screenshots: bool = True) -> PageSnapshot:
-    """Synchronous wrapper for crawl_page."""
-    return asyncio.run(crawl_page(url, output_dir, screenshots))
+async def crawl_many(
+    urls: list[str],
+    output_dir: Optional[str] = None,
+    capture_screenshots: bool = True,
+    concurrency: Optional[int] = None,
+    screenshot_mode: ScreenshotMode = "full",
+    block_trackers: bool = False,
+) -> list[PageSnapshot]:
+    """
+    Crawl several landing pages at once in the pooled browser.
+
+    At most `concurrency` pages (default: CPU count, capped at 8) are in
+    flight; each gets its own browser contexts, and its screenshots go to
+    <output_dir>/<index> so pages don't overwrite each other's. Snapshots
+    come back in the order of `urls`. If any crawl fails, the rest are
+    cancelled and the error is raised.
+    """
+    out = Path(output_dir or OUTPUT_DIR)
+    sem = asyncio.Semaphore(max(1, concurrency or min(os.cpu_count() or 1, 8)))
+
+    async def crawl_one(i: int, url: str) -> PageSnapshot:
+        async with sem:
+            return await crawl_page(url, str(out / str(i)), capture_screenshots,
+                                    screenshot_mode, block_trackers)
+
+    tasks = [asyncio.ensure_future(crawl_one(i, url)) for i, url in enumerate(urls)]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+# crawl_sync's crawls all run on this one background loop, so its pooled
+# browser stays warm between calls instead of dying with each asyncio.run()
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="qa-crawler", daemon=True).start()
+            atexit.register(_close_sync_loop, loop)
+            _sync_loop = loop
+        return _sync_loop
+
+
+def _close_sync_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Close the pooled browser and Playwright driver, then stop the loop."""
+    try:
+        asyncio.run_coroutine_threadsafe(BrowserPool.shutdown(), loop).result(timeout=10)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+
+def crawl_sync(url: str, output_dir: str | None = None, screenshots: bool = True,
+               screenshot_mode: ScreenshotMode = "full") -> PageSnapshot:
+    """Synchronous wrapper for crawl_page. Safe to call from any thread."""
+    future = asyncio.run_coroutine_threadsafe(
+        crawl_page(url, output_dir, screenshots, screenshot_mode), _get_sync_loop()
+    )
+    return future.result()
@@ -0,0 +1,133 @@
+"""
+qa_agent/dom.py — Parsed views of a snapshot's DOM HTML, shared by the check modules.
+
+The HTML is walked once per snapshot and the result is cached on it, so checks
+that need visible text, headings, anchors or the lowercased HTML don't each redo the work.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from html.parser import HTMLParser
+
+from qa_agent.config import PageSnapshot
+
+
+_INVISIBLE_TAGS = ("script", "style", "noscript")
+_HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+_FEED_CHUNK = 64 * 1024
+# Parsed views are also memoised by the HTML itself, so QA re-run on an unchanged
+# page (a cached crawl in the app, a repeated batch) skips the work entirely.
+# Kept small: each entry holds a whole page.
+_CONTENT_CACHE_SIZE = 8
+
+
+@dataclass(slots=True)
+class DomIndex:
+    """Everything the checks read from a single parse of the page HTML."""
+    visible_text: str
+    headings: list[str]      # text of each non-empty h1–h6, inner tags stripped
+    anchors: list[tuple[str, str]]  # (href, lowercased inner text + nested tag attribute values)
+
+
+class _DomParser(HTMLParser):
+    """Collect visible text (skipping script/style), headings and anchors from HTML."""
+    def __init__(self):
+        super().__init__()
+        self.text_parts = []
+        self.headings = []
+        self._skip = False
+        self._heading_parts = None  # list while inside a heading
+        self.anchors = []
+        self._anchor = None  # (href, inner parts) while inside an <a href>
+        self._pending = []  # data seen since the last markup event
+
+    def handle_data(self, data):
+        # Chunked feeding can split one text node across several calls, so
+        # hold the pieces until the next tag/comment closes the node
+        self._pending.append(data)
+
+    def _flush_text(self):
+        if not self._pending:
+            return
+        data = "".join(self._pending)
+        self._pending.clear()
+        if self._heading_parts is not None:
+            self._heading_parts.append(data)
+        if self._anchor is not None:
+            self._anchor[1].append(data)
+        if not self._skip:
+            stripped = data.strip()
+            if stripped:
+                self.text_parts.append(stripped)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    handle_decl = handle_pi = unknown_decl = handle_comment
+
+    def close(self):
+        super().close()
+        self._flush_text()
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if self._anchor is not None:
+            self._anchor[1].extend(v for _k, v in attrs if v)
+        if tag in _INVISIBLE_TAGS:
+            self._skip = True
+        elif tag in _HEADING_TAGS:
+            self._heading_parts = []
+        elif tag == "a":
+            href = dict(attrs).get("href")
+            self._anchor = (href, []) if href else None
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in _INVISIBLE_TAGS:
+            self._skip = False
+        elif tag == "a" and self._anchor is not None:
+            href, parts = self._anchor
+            self.anchors.append((href, " ".join(parts).lower()))
+            self._anchor = None
+        elif tag in _HEADING_TAGS and self._heading_parts is not None:
+            heading = "".join(self._heading_parts).strip()
+            if heading:
+                self.headings.append(heading)
+            self._heading_parts = None
+
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def parse_html(html: str) -> DomIndex:
+    """Walk the HTML once and collect every view the checks need."""
+    parser = _DomParser()
+    try:
+        # Fed in slices so a multi-megabyte page never sits in the parser's
+        # raw buffer (and its per-call slices) all at once
+        for start in range(0, len(html), _FEED_CHUNK):
+            parser.feed(html[start:start + _FEED_CHUNK])
+        parser.close()
+    except Exception:
+        pass
+    return DomIndex(
+        visible_text=" ".join(parser.text_parts),
+        headings=parser.headings,
+        anchors=parser.anchors,
+    )
+
+
+def dom_index(snap: PageSnapshot) -> DomIndex:
+    """The snapshot's DomIndex, parsed on first use."""
+    return snap.cached("dom_index", lambda: parse_html(snap.dom_html))
+
+
+def html_lower(snap: PageSnapshot) -> bytes:
+    """The snapshot's DOM HTML as lowercased UTF-8, for case-insensitive marker tests."""
+    # bytes, not str: one non-ASCII character makes the whole str 2-4 bytes per
+    # char, so the encoded copy is smaller to search. Test it with ASCII b"..." markers
+    return snap.cached("html_lower", lambda: _lower_utf8(snap.dom_html))
+
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _lower_utf8(html: str) -> bytes:
+    return html.encode("utf-8", "ignore").lower()
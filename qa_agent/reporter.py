@@ -3,6 +3,8 @@ qa_agent/reporter.py — Format QA results for terminal + markdown + Asana.
 """
 from __future__ import annotations
 
+import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
@@ -30,51 +32,59 @@ def print_terminal(report: QAReport) -> None:
     report.build_summary()
     s = report.summary
 
-    print()
-    print("=" * 70)
-    print(f"  QA REPORT — {report.context.landing_page_url}")
-    print(f"  {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    print("=" * 70)
-    print()
-    print(f"  TOTAL: {s['total']}  |  "
-          f"✅ {s['passed']}  ❌ {s['failed']}  ⚠️ {s['warnings']}  ⏭️ {s['skipped']}")
-    print(f"  Pass rate: {s['pass_rate']}")
-    print()
-
-    # By category
+    # Built up and written once: one write instead of a few hundred small
+    # ones, and batch runs can't interleave another page's output mid-report
+    lines = [
+        "",
+        "=" * 70,
+        f"  QA REPORT — {report.context.landing_page_url}",
+        f"  {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        "=" * 70,
+        "",
+        f"  TOTAL: {s['total']}  |  "
+        f"✅ {s['passed']}  ❌ {s['failed']}  ⚠️ {s['warnings']}  ⏭️ {s['skipped']}",
+        f"  Pass rate: {s['pass_rate']}",
+        "",
+    ]
+
+    # By category — bucketed in one pass rather than a filter per category
+    by_cat: defaultdict[str, list[CheckResult]] = defaultdict(list)
+    for r in report.results:
+        by_cat[r.category].append(r)
     for cat, cat_data in s["by_category"].items():
-        print(f"  ── {cat.upper()} ({cat_data['total']} checks) ──")
-        cat_results = [r for r in report.results if r.category == cat]
-        for r in cat_results:
+        lines.append(f"  ── {cat.upper()} ({cat_data['total']} checks) ──")
+        for r in by_cat[cat]:
             icon = STATUS_ICONS[r.status]
             color = STATUS_COLORS[r.status]
-            print(f"    {icon} {color}{r.name}{RESET}")
-            print(f"       {r.message[:120]}")
+            lines.append(f"    {icon} {color}{r.name}{RESET}")
+            lines.append(f"       {r.message[:120]}")
             if r.evidence and r.status != CheckStatus.PASS:
                 for line in r.evidence.split("\n")[:3]:
-                    print(f"       → {line[:100]}")
-        print()
+                    lines.append(f"       → {line[:100]}")
+        lines.append("")
 
     # Failures summary
     if report.failed:
-        print("  🚨 FAILURES REQUIRING ACTION:")
+        lines.append("  🚨 FAILURES REQUIRING ACTION:")
         for r in report.failed:
-            print(f"    ❌ [{r.category}] {r.name}: {r.message[:100]}")
-        print()
+            lines.append(f"    ❌ [{r.category}] {r.name}: {r.message[:100]}")
+        lines.append("")
 
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
-def to_markdown(report: QAReport, output_dir: str | None = None) -> str:
-    """Generate a markdown report file. Returns the file path."""
+
+def render_markdown(report: QAReport, now: datetime | None = None) -> str:
+    """Render the markdown report as a string, dated `now` (default: the current time)."""
     report.build_summary()
     s = report.summary
-    out = Path(output_dir or OUTPUT_DIR)
-    out.mkdir(parents=True, exist_ok=True)
+    now = now or datetime.now()
 
     lines = [
         f"# QA Report",
         f"",
         f"**URL:** {report.context.landing_page_url}",
-        f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        f"**Date:** {now.strftime('%Y-%m-%d %H:%M')}",
         f"**Client:** {report.context.client_name or 'N/A'}",
         f"**Campaign:** {report.context.campaign_name or 'N/A'}",
         f"",
@@ -129,9 +139,19 @@ def to_markdown(report: QAReport, output_dir: str | None = None) -> str:
             lines.append(f"- **{r.name}** ({r.category}): {r.message[:120]}")
         lines.append("")
 
-    content = "\n".join(lines)
-    filepath = out / f"qa_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-    filepath.write_text(content, encoding="utf-8")
+    return "\n".join(lines)
+
+
+def to_markdown(report: QAReport, output_dir: str | None = None) -> str:
+    """Generate a markdown report file. Returns the file path."""
+    # One clock read so the filename and the Date line agree
+    now = datetime.now()
+    content = render_markdown(report, now)
+    out = Path(output_dir or OUTPUT_DIR)
+    out.mkdir(parents=True, exist_ok=True)
+    filepath = out / f"qa_report_{now.strftime('%Y%m%d_%H%M%S')}.md"
+    # Encoded once and written as bytes: no text-mode newline translation
+    filepath.write_bytes(content.encode("utf-8"))
     return str(filepath)
 
 
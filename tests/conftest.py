@@ -0,0 +1,37 @@
+"""
+tests/conftest.py — Shared pytest configuration.
+
+Run only the quick unit checks: python -m pytest tests/ --fast
+"""
+import gc
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption("--fast", action="store_true",
+                     help="Skip tests marked slow (the full check pipeline)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: runs the full check pipeline")
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--fast"):
+        return
+    slow = [item for item in items if "slow" in item.keywords]
+    if slow:
+        config.hook.pytest_deselected(items=slow)
+        items[:] = [item for item in items if "slow" not in item.keywords]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _collect_once_per_module():
+    """Hold off the cyclic GC while a module runs, then collect once at the end."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    yield
+    gc.collect()
+    if was_enabled:
+        gc.enable()
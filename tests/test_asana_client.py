@@ -0,0 +1,114 @@
+"""
+tests/test_asana_client.py — Asana integration tests against a stub client.
+
+Run: python -m pytest tests/test_asana_client.py -v
+"""
+import pytest
+from qa_agent import asana_client
+from qa_agent.asana_client import TASK_OPT_FIELDS, build_context_from_task, get_qa_tasks
+
+
+TASK = {
+    "gid": "1200000000000001",
+    "name": "Summer promo LP",
+    "notes": (
+        "LP: https://promo.unbounce.com/summer\n"
+        "Design: https://www.figma.com/file/abc123\n"
+        "Copy: https://docs.google.com/document/d/xyz\n"
+    ),
+    "custom_fields": [{"name": "Client", "display_value": "Acme Corp"}],
+    "parent": {"name": "Summer 2025"},
+}
+
+
+class _Tasks:
+    def __init__(self, tasks: list[dict]):
+        self.tasks = tasks
+        self.calls = []
+
+    def get_task(self, task_gid, opt_fields=None):
+        self.calls.append(("get_task", task_gid, opt_fields))
+        return next(t for t in self.tasks if t["gid"] == task_gid)
+
+    def get_tasks(self, params, opt_fields=None):
+        self.calls.append(("get_tasks", params, opt_fields))
+        return iter(self.tasks)
+
+
+class _Sections:
+    def __init__(self, sections: list[dict]):
+        self.sections = sections
+        self.calls = 0
+
+    def get_sections_for_project(self, project_gid):
+        self.calls += 1
+        return iter(self.sections)
+
+
+class StubClient:
+    """Just enough of asana.Client for the calls asana_client makes."""
+
+    def __init__(self, tasks=(), sections=()):
+        self.tasks = _Tasks(list(tasks))
+        self.sections = _Sections(list(sections))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_section_cache():
+    asana_client._resolve_section_gid.cache_clear()
+    yield
+    asana_client._resolve_section_gid.cache_clear()
+
+
+class TestBuildContext:
+
+    def test_prefetched_task_dict_skips_the_get(self):
+        client = StubClient()
+        ctx = build_context_from_task(TASK, client)
+        assert client.tasks.calls == []
+        assert ctx.landing_page_url == "https://promo.unbounce.com/summer"
+        assert ctx.figma_url == "https://www.figma.com/file/abc123"
+        assert ctx.copy_doc_url == "https://docs.google.com/document/d/xyz"
+        assert ctx.client_name == "Acme Corp"
+        assert ctx.campaign_name == "Summer 2025"
+        assert ctx.asana_task_id == TASK["gid"]
+
+    def test_task_gid_is_fetched_with_context_fields(self):
+        client = StubClient(tasks=[TASK])
+        ctx = build_context_from_task(TASK["gid"], client)
+        assert client.tasks.calls == [("get_task", TASK["gid"], TASK_OPT_FIELDS)]
+        assert ctx == build_context_from_task(TASK, StubClient())
+
+
+class TestSections:
+
+    SECTIONS = [{"gid": "111", "name": "Backlog"}, {"gid": "222", "name": "Ready for QA"}]
+
+    def test_section_lookup_cached_per_client(self):
+        client = StubClient(sections=self.SECTIONS)
+        assert asana_client._resolve_section_gid(client, "P1", "qa") == "222"
+        assert asana_client._resolve_section_gid(client, "P1", "qa") == "222"
+        assert client.sections.calls == 1
+        other = StubClient(sections=self.SECTIONS)
+        assert asana_client._resolve_section_gid(other, "P1", "qa") == "222"
+        assert other.sections.calls == 1
+
+    def test_section_gid_passed_through(self):
+        client = StubClient(sections=self.SECTIONS)
+        assert asana_client._resolve_section_gid(client, "P1", "1200000000000999") == "1200000000000999"
+        assert client.sections.calls == 0
+
+    def test_unknown_section(self):
+        with pytest.raises(ValueError, match="Ready for QA"):
+            asana_client._resolve_section_gid(StubClient(sections=self.SECTIONS), "P1", "Done")
+
+    def test_qa_tasks_feed_build_context(self):
+        done = {**TASK, "gid": "1200000000000002", "completed": True}
+        client = StubClient(tasks=[{**TASK, "completed": False}, done], sections=self.SECTIONS)
+        tasks = get_qa_tasks("P1", "QA", client=client)
+        assert [t["gid"] for t in tasks] == [TASK["gid"]]
+        (call,) = client.tasks.calls
+        assert call == ("get_tasks", {"section": "222"}, ["gid", "completed", *TASK_OPT_FIELDS])
+        # Listed tasks already carry the context fields: no per-task GET
+        assert build_context_from_task(tasks[0], client).landing_page_url == "https://promo.unbounce.com/summer"
+        assert len(client.tasks.calls) == 1
@@ -2,85 +2,117 @@
 tests/test_checks.py — Unit tests for QA checks using mock page data.
 
 Run: python -m pytest tests/ -v
+     python -m pytest tests/ --fast   # skip the full-pipeline tests
+     python -m pytest tests/ -n auto  # spread over all cores (pytest-xdist)
 """
-import pytest
-from qa_agent.config import PageSnapshot, QAContext, CheckStatus
-
+from collections import defaultdict
+from dataclasses import FrozenInstanceError, replace
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 
-def _make_snapshot(**overrides) -> PageSnapshot:
-    """Create a mock PageSnapshot with sensible defaults."""
-    defaults = dict(
-        url="https://example.com/landing-page",
-        final_url="https://example.com/landing-page",
-        title="Acme Corp | Summer Campaign",
-        meta_title="Acme Corp - Get Started Today",
-        status_code=200,
-        console_errors=[],
-        console_warnings=[],
-        network_requests=[],
-        fonts_loaded=["Montserrat", "Open Sans", "sans-serif"],
-        images=[
-            {"src": "https://example.com/hero.webp", "alt": "Hero", "width": 800,
-             "height": 400, "naturalWidth": 800, "naturalHeight": 400,
-             "format": "webp", "hasTransparency": False},
+import pytest
+from qa_agent.checks import copywriter, designer, developer, run_all
+from qa_agent.config import PageSnapshot, QAContext, QAReport, CheckStatus
+from qa_agent.dom import dom_index, html_lower
+from qa_agent.reporter import to_asana_comment, to_markdown
+
+
+PASS, FAIL, WARN, SKIP = CheckStatus.PASS, CheckStatus.FAIL, CheckStatus.WARN, CheckStatus.SKIP
+
+
+def _frozen(value):
+    """Read-only copy of nested test data: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _frozen(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(v) for v in value)
+    return value
+
+
+# Built once and shared by every snapshot. Frozen all the way down, so a test
+# or check that mutates the defaults fails instead of leaking into later tests
+_SNAPSHOT_DEFAULTS = _frozen(dict(
+    url="https://example.com/landing-page",
+    final_url="https://example.com/landing-page",
+    title="Acme Corp | Summer Campaign",
+    meta_title="Acme Corp - Get Started Today",
+    status_code=200,
+    console_errors=[],
+    console_warnings=[],
+    network_requests=[],
+    fonts_loaded=["Montserrat", "Open Sans", "sans-serif"],
+    images=[
+        {"src": "https://example.com/hero.webp", "alt": "Hero", "width": 800,
+         "height": 400, "naturalWidth": 800, "naturalHeight": 400,
+         "format": "webp", "hasTransparency": False},
+    ],
+    links=[
+        {"href": "https://example.com/landing-page#form", "text": "Get Started", "target": "", "tag": "a"},
+        {"href": "https://example.com/privacy", "text": "Privacy Policy", "target": "_blank", "tag": "a"},
+    ],
+    forms=[
+        {
+            "id": "lp-pom-form-42",
+            "action": "/submit",
+            "method": "post",
+            "fields": [
+                {"name": "first_name", "type": "text", "id": "fname", "placeholder": "First Name",
+                 "required": True, "value": "", "label": "First Name"},
+                {"name": "email", "type": "email", "id": "email", "placeholder": "Email",
+                 "required": True, "value": "", "label": "Email"},
+            ],
+        }
+    ],
+    scripts=[
+        {"src": "https://cdn.example.com/app.min.js", "inline_length": 0},
+        {"src": "", "inline_length": 500},
+    ],
+    sticky_elements=[
+        {"tag": "div", "id": "sticky-cta", "classes": "sticky-bar", "text": "Get Started Now", "position": "fixed"},
+    ],
+    dom_html="<html><head><title>Acme Corp</title></head><body><div>Content</div></body></html>",
+    mobile_snapshot={
+        "sticky_elements": [
+            {"tag": "div", "id": "sticky-cta", "classes": "sticky-bar",
+             "text": "Get Started Now", "position": "fixed"},
         ],
-        links=[
-            {"href": "https://example.com/landing-page#form", "text": "Get Started", "target": "", "tag": "a"},
-            {"href": "https://example.com/privacy", "text": "Privacy Policy", "target": "_blank", "tag": "a"},
+        "forms": [
+            {"id": "lp-pom-form-42", "fields": [
+                {"name": "first_name", "type": "text"},
+                {"name": "email", "type": "email"},
+            ]},
         ],
-        forms=[
-            {
-                "id": "lp-pom-form-42",
-                "action": "/submit",
-                "method": "post",
-                "fields": [
-                    {"name": "first_name", "type": "text", "id": "fname", "placeholder": "First Name",
-                     "required": True, "value": "", "label": "First Name"},
-                    {"name": "email", "type": "email", "id": "email", "placeholder": "Email",
-                     "required": True, "value": "", "label": "Email"},
-                ],
-            }
+        "images": [
+            {"src": "https://example.com/hero.webp", "naturalWidth": 800, "width": 375},
         ],
-        scripts=[
-            {"src": "https://cdn.example.com/app.min.js", "inline_length": 0},
-            {"src": "", "inline_length": 500},
+        "cta_buttons": [
+            {"text": "Get Started", "tag": "a", "href": "#form", "type": ""},
         ],
-        sticky_elements=[
-            {"tag": "div", "id": "sticky-cta", "classes": "sticky-bar", "text": "Get Started Now", "position": "fixed"},
+        "links": [
+            {"href": "#form", "text": "Get Started", "target": "", "tag": "a"},
+            {"href": "/privacy", "text": "Privacy", "target": "", "tag": "a"},
         ],
-        dom_html="<html><head><title>Acme Corp</title></head><body><div>Content</div></body></html>",
-        mobile_snapshot={
-            "sticky_elements": [
-                {"tag": "div", "id": "sticky-cta", "classes": "sticky-bar",
-                 "text": "Get Started Now", "position": "fixed"},
-            ],
-            "forms": [
-                {"id": "lp-pom-form-42", "fields": [
-                    {"name": "first_name", "type": "text"},
-                    {"name": "email", "type": "email"},
-                ]},
-            ],
-            "images": [
-                {"src": "https://example.com/hero.webp", "naturalWidth": 800, "width": 375},
-            ],
-            "cta_buttons": [
-                {"text": "Get Started", "tag": "a", "href": "#form", "type": ""},
-            ],
-            "links": [
-                {"href": "#form", "text": "Get Started", "target": "", "tag": "a"},
-                {"href": "/privacy", "text": "Privacy", "target": "", "tag": "a"},
-            ],
-            "fonts": ["Montserrat", "Open Sans"],
-        },
-        compression="br",
-        screenshot_desktop=None,
-        screenshot_mobile=None,
-        redirect_chain=["https://example.com/landing-page"],
-        page_size_bytes=150000,
-        load_time_ms=1200,
-    )
-    defaults.update(overrides)
-    return PageSnapshot(**defaults)
+        "fonts": ["Montserrat", "Open Sans"],
+    },
+    compression="br",
+    screenshot_desktop=None,
+    screenshot_mobile=None,
+    redirect_chain=["https://example.com/landing-page"],
+    page_size_bytes=150000,
+    load_time_ms=1200,
+))
+
+
+def _make_snapshot(**overrides) -> PageSnapshot:
+    """Create a mock PageSnapshot with sensible defaults."""
+    return PageSnapshot(**{**_SNAPSHOT_DEFAULTS, **overrides})
+
+
+@pytest.fixture(scope="module")
+def snapshot() -> PageSnapshot:
+    """The default snapshot, shared by tests that don't override anything."""
+    return _make_snapshot()
 
 
 def _make_context(**overrides) -> QAContext:
@@ -94,245 +126,362 @@ def _make_context(**overrides) -> QAContext:
     return QAContext(**defaults)
 
 
-# ────────────────────── Developer Checks ──────────────────────
+@pytest.fixture(scope="session")
+def ctx() -> QAContext:
+    """The default context; checks only read it, so one instance serves every test."""
+    return _make_context()
 
-class TestDeveloperChecks:
 
-    def test_form_id_pass(self):
-        from qa_agent.checks.developer import _check_form_id
-        result = _check_form_id(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_form_id_fail(self):
-        from qa_agent.checks.developer import _check_form_id
-        snap = _make_snapshot(forms=[{"id": "wrong-form", "action": "/", "method": "post", "fields": []}])
-        result = _check_form_id(snap, _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_console_errors_pass(self):
-        from qa_agent.checks.developer import _check_console_errors
-        result = _check_console_errors(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_console_errors_fail(self):
-        from qa_agent.checks.developer import _check_console_errors
-        snap = _make_snapshot(console_errors=[
-            {"type": "error", "text": "Uncaught TypeError: null is not an object", "url": "app.js", "line": 42}
-        ])
-        result = _check_console_errors(snap, _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_server_compression_brotli(self):
-        from qa_agent.checks.developer import _check_server_compression
-        result = _check_server_compression(_make_snapshot(compression="br"), _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_server_compression_none(self):
-        from qa_agent.checks.developer import _check_server_compression
-        result = _check_server_compression(_make_snapshot(compression=None), _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_sticky_cta_mobile_pass(self):
-        from qa_agent.checks.developer import _check_sticky_cta_mobile
-        result = _check_sticky_cta_mobile(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_sticky_cta_mobile_fail(self):
-        from qa_agent.checks.developer import _check_sticky_cta_mobile
-        snap = _make_snapshot(mobile_snapshot={"sticky_elements": [], "forms": [], "images": [],
-                                                "cta_buttons": [], "links": [], "fonts": []})
-        result = _check_sticky_cta_mobile(snap, _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_image_formats_modern(self):
-        from qa_agent.checks.developer import _check_image_formats
-        result = _check_image_formats(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_url_no_variant_pass(self):
-        from qa_agent.checks.developer import _check_urls_no_variant
-        result = _check_urls_no_variant(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_url_variant_fail(self):
-        from qa_agent.checks.developer import _check_urls_no_variant
-        snap = _make_snapshot(final_url="https://example.com/landing-page/a")
-        result = _check_urls_no_variant(snap, _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_form_values_clean(self):
-        from qa_agent.checks.developer import _check_form_values_no_codes
-        result = _check_form_values_no_codes(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_form_values_with_codes(self):
-        from qa_agent.checks.developer import _check_form_values_no_codes
-        snap = _make_snapshot(forms=[{
+# ────────────────────── Developer Checks ──────────────────────
+
+# (check, snapshot overrides, expected status); {} means the shared default snapshot
+DEV_CASES = [
+    pytest.param(developer._check_form_id, {}, PASS, id="form_id_pass"),
+    pytest.param(developer._check_form_id, {
+        "forms": [{"id": "wrong-form", "action": "/", "method": "post", "fields": []}],
+    }, FAIL, id="form_id_fail"),
+    pytest.param(developer._check_console_errors, {}, PASS, id="console_errors_pass"),
+    pytest.param(developer._check_console_errors, {
+        "console_errors": [
+            {"type": "error", "text": "Uncaught TypeError: null is not an object", "url": "app.js", "line": 42},
+        ],
+    }, FAIL, id="console_errors_fail"),
+    pytest.param(developer._check_server_compression, {"compression": "br"}, PASS,
+                 id="server_compression_brotli"),
+    pytest.param(developer._check_server_compression, {"compression": None}, FAIL,
+                 id="server_compression_none"),
+    pytest.param(developer._check_sticky_cta_mobile, {}, PASS, id="sticky_cta_mobile_pass"),
+    pytest.param(developer._check_sticky_cta_mobile, {
+        "mobile_snapshot": {"sticky_elements": [], "forms": [], "images": [],
+                            "cta_buttons": [], "links": [], "fonts": []},
+    }, FAIL, id="sticky_cta_mobile_fail"),
+    pytest.param(developer._check_image_formats, {}, PASS, id="image_formats_modern"),
+    pytest.param(developer._check_urls_no_variant, {}, PASS, id="url_no_variant_pass"),
+    pytest.param(developer._check_urls_no_variant, {"final_url": "https://example.com/landing-page/a"},
+                 FAIL, id="url_variant_fail"),
+    pytest.param(developer._check_form_values_no_codes, {}, PASS, id="form_values_clean"),
+    pytest.param(developer._check_form_values_no_codes, {
+        "forms": [{
             "id": "form1", "action": "/", "method": "post",
             "fields": [{"name": "hidden", "type": "hidden", "id": "h1",
                         "placeholder": "", "required": False,
                         "value": "{{campaign_id}}", "label": ""}],
-        }])
-        result = _check_form_values_no_codes(snap, _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_page_speed_pass(self):
-        from qa_agent.checks.developer import _check_page_speed
-        result = _check_page_speed(_make_snapshot(load_time_ms=1200), _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_page_speed_fail(self):
-        from qa_agent.checks.developer import _check_page_speed
-        result = _check_page_speed(_make_snapshot(load_time_ms=5000), _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_gtm_present_pass(self):
-        from qa_agent.checks.developer import _check_gtm_present
-        snap = _make_snapshot(
-            scripts=[{"src": "https://www.googletagmanager.com/gtm.js?id=GTM-ABCD1234", "inline_length": 0}]
-        )
-        result = _check_gtm_present(snap, _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_gtm_present_fail(self):
-        from qa_agent.checks.developer import _check_gtm_present
-        result = _check_gtm_present(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_footer_legal_links_pass(self):
-        from qa_agent.checks.developer import _check_footer_legal_links
-        snap = _make_snapshot(links=[
+        }],
+    }, FAIL, id="form_values_with_codes"),
+    pytest.param(developer._check_page_speed, {"load_time_ms": 1200}, PASS, id="page_speed_pass"),
+    pytest.param(developer._check_page_speed, {"load_time_ms": 5000}, FAIL, id="page_speed_fail"),
+    pytest.param(developer._check_gtm_present, {
+        "scripts": [{"src": "https://www.googletagmanager.com/gtm.js?id=GTM-ABCD1234", "inline_length": 0}],
+    }, PASS, id="gtm_present_pass"),
+    pytest.param(developer._check_gtm_present, {}, FAIL, id="gtm_present_fail"),
+    pytest.param(developer._check_footer_legal_links, {
+        "links": [
             {"href": "https://example.com/terms", "text": "Terms & Conditions", "target": "_blank", "tag": "a"},
             {"href": "https://example.com/privacy", "text": "Privacy Policy", "target": "_blank", "tag": "a"},
             {"href": "https://example.com/disclaimer", "text": "Disclaimer", "target": "_blank", "tag": "a"},
-        ])
-        result = _check_footer_legal_links(snap, _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_footer_legal_links_missing_privacy(self):
-        from qa_agent.checks.developer import _check_footer_legal_links
-        snap = _make_snapshot(links=[
-            {"href": "https://example.com/terms", "text": "Terms", "target": "_blank", "tag": "a"},
-        ])
-        result = _check_footer_legal_links(snap, _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_cache_headers_with_cdn(self):
-        from qa_agent.checks.developer import _check_cache_headers
-        snap = _make_snapshot(network_requests=[
+        ],
+    }, PASS, id="footer_legal_links_pass"),
+    pytest.param(developer._check_footer_legal_links, {
+        "links": [{"href": "https://example.com/terms", "text": "Terms", "target": "_blank", "tag": "a"}],
+    }, FAIL, id="footer_legal_links_missing_privacy"),
+    pytest.param(developer._check_cache_headers, {
+        "network_requests": [
             {"url": "https://cdn.example.com/app.js", "status": 200, "resource_type": "script", "size": 5000},
-        ])
-        result = _check_cache_headers(snap, _make_context())
-        assert result.status == CheckStatus.PASS
-
-    def test_cache_headers_no_cdn(self):
-        from qa_agent.checks.developer import _check_cache_headers
-        result = _check_cache_headers(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.WARN
-
-    def test_full_developer_run(self):
-        from qa_agent.checks.developer import run
-        results = run(_make_snapshot(), _make_context())
-        assert len(results) == 37
-        statuses = [r.status for r in results]
-        # With good defaults, we should get mostly PASS/WARN/SKIP, no unexpected errors
-        assert CheckStatus.FAIL not in statuses or all(
-            r.check_id in ("correct_group", "gtm_present", "footer_legal_links")
-            for r in results if r.status == CheckStatus.FAIL
+        ],
+    }, PASS, id="cache_headers_with_cdn"),
+    pytest.param(developer._check_cache_headers, {}, WARN, id="cache_headers_no_cdn"),
+]
+
+
+class TestDeveloperChecks:
+
+    @pytest.mark.parametrize("check, overrides, expected", DEV_CASES)
+    def test_check_status(self, snapshot, ctx, check, overrides, expected):
+        snap = _make_snapshot(**overrides) if overrides else snapshot
+        assert check(snap, ctx).status is expected
+
+    def test_carousel_transition_only_for_auto_carousels(self, ctx):
+        snap = _make_snapshot(dom_html='<div class="glide"><ul class="glide__slides"></ul></div>')
+        assert developer._check_carousel_functioning(snap, ctx).status is WARN
+        assert developer._check_carousel_transition(snap, ctx).status is SKIP
+
+    def test_crawler_flags_take_precedence(self, ctx):
+        snap = _make_snapshot(
+            dom_html='<html><body><input placeholder="Email"><!-- unbounce --></body></html>',
+            flags={"is_unbounce": False, "has_placeholder_css": False},
         )
+        assert developer._check_correct_group(snap, ctx).status is SKIP
+        assert developer._check_placeholder_styling(snap, ctx).status is WARN
+        # Unreadable (cross-origin) stylesheets leave the flag unset: HTML fallback
+        snap = _make_snapshot(
+            dom_html="<html><style>input::placeholder{color:#999}</style></html>",
+            flags={"is_unbounce": False},
+        )
+        assert developer._check_placeholder_styling(snap, ctx).status is PASS
+
+    @pytest.mark.parametrize("dom_html, scripts", [
+        ("<html><script>window.ubPage = 'UnBounce';</script></html>", []),
+        ("<html><div data-platform='unbounce'></div></html>", []),
+        ("<html></html>", [{"src": "https://Assets.Unbounce.com/lp.js", "inline_length": 0}]),
+    ])
+    def test_unbounce_detected_without_selector_markers(self, ctx, dom_html, scripts):
+        snap = _make_snapshot(dom_html=dom_html, scripts=scripts)
+        assert developer._check_correct_group(snap, ctx).status is WARN
+
+    def test_cta_hover_color_from_crawler_stats(self, ctx):
+        snap = _make_snapshot(cta_transition_stats={"cta_count": 3, "transition_count": 2})
+        assert developer._check_cta_hover_color(snap, ctx).status is PASS
+        snap = _make_snapshot(cta_transition_stats={"cta_count": 3, "transition_count": 0})
+        assert developer._check_cta_hover_color(snap, ctx).status is WARN
+
+    def test_dom_scans_from_crawler_stats(self, ctx):
+        snap = _make_snapshot(
+            dom_html="<html><style>\n.a{}\n.b{}\n</style><body>GTM-ABCD12</body></html>",
+            inline_css_stats={"chars": 10_000, "newlines": 2},
+            gtm_container_ids=[],
+            scripts=[],
+        )
+        assert developer._check_code_minification(snap, ctx).status is PASS
+        assert developer._check_gtm_present(snap, ctx).status is FAIL
+
+    def test_malformed_entries_only_break_their_checks(self, snapshot, ctx):
+        snap = _make_snapshot(
+            forms=[{"id": "lp-pom-form-42", "action": "/submit"}],  # no "fields"
+            scripts=[{"src": None, "inline_length": 500}],
+            network_requests=[{"url": None, "headers": {}}],
+        )
+        errored = {r.check_id for r in developer.run(snap, ctx) if r.message.startswith("Check raised an error")}
+        assert errored == {
+            "_check_form_fields", "_check_field_names_standard",
+            "_check_form_validation", "_check_form_values_no_codes",
+        }
+        for check in (developer._check_gtm_present, developer._check_cache_headers,
+                      developer._check_carousel_functioning, developer._check_sms_verification,
+                      developer._check_code_minification, developer._check_correct_group):
+            assert check(snap, ctx).status is check(snapshot, ctx).status
 
 
 # ────────────────────── Designer Checks ──────────────────────
 
-class TestDesignerChecks:
+DES_CASES = [
+    pytest.param(designer._check_fonts_correct, {}, PASS, id="fonts_loaded"),
+    pytest.param(designer._check_fonts_correct, {"fonts_loaded": ["Arial", "Helvetica", "sans-serif"]},
+                 FAIL, id="fonts_system_only"),
+    pytest.param(designer._check_logo_no_link, {}, PASS, id="logo_no_link"),
+    pytest.param(designer._check_logo_no_link, {
+        "dom_html": (
+            '<html><body><header><a href="https://acme.com"><img src="/img/acme.png" alt="Acme logo"></a>'
+            '</header></body></html>'
+        ),
+    }, FAIL, id="logo_links_out"),
+]
 
-    def test_fonts_loaded(self):
-        from qa_agent.checks.designer import _check_fonts_correct
-        result = _check_fonts_correct(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
 
-    def test_fonts_system_only(self):
-        from qa_agent.checks.designer import _check_fonts_correct
-        snap = _make_snapshot(fonts_loaded=["Arial", "Helvetica", "sans-serif"])
-        result = _check_fonts_correct(snap, _make_context())
-        assert result.status == CheckStatus.FAIL
-
-    def test_logo_no_link(self):
-        from qa_agent.checks.designer import _check_logo_no_link
-        result = _check_logo_no_link(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
+class TestDesignerChecks:
 
-    def test_full_designer_run(self):
-        from qa_agent.checks.designer import run
-        results = run(_make_snapshot(), _make_context())
-        assert len(results) == 11
+    @pytest.mark.parametrize("check, overrides, expected", DES_CASES)
+    def test_check_status(self, snapshot, ctx, check, overrides, expected):
+        snap = _make_snapshot(**overrides) if overrides else snapshot
+        assert check(snap, ctx).status is expected
 
 
 # ────────────────────── Copywriter Checks ──────────────────────
 
+COPY_CASES = [
+    pytest.param(copywriter._check_meta_page_title, {}, PASS, id="meta_title_pass"),
+    pytest.param(copywriter._check_meta_page_title, {"title": ""}, FAIL, id="meta_title_missing"),
+    pytest.param(copywriter._check_form_labels, {}, PASS, id="form_labels_present"),
+]
+
+
 class TestCopywriterChecks:
 
-    def test_meta_title_pass(self):
-        from qa_agent.checks.copywriter import _check_meta_page_title
-        result = _check_meta_page_title(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
+    @pytest.mark.parametrize("check, overrides, expected", COPY_CASES)
+    def test_check_status(self, snapshot, ctx, check, overrides, expected):
+        snap = _make_snapshot(**overrides) if overrides else snapshot
+        assert check(snap, ctx).status is expected
+
+    def test_capitalisation_mixed(self, ctx):
+        snap = _make_snapshot(dom_html=(
+            "<html><body><h1>Build Your <em>Dream</em> Home</h1><h2>Move In Today</h2>"
+            "<h2>Find your block</h2><h3>Talk to our team</h3></body></html>"
+        ))
+        result = copywriter._check_capitalisation_consistency(snap, ctx)
+        assert result.status is WARN
+        assert "Build Your Dream Home" in result.evidence
+
+
+# ────────────────────── DOM Views ──────────────────────
+
+class TestDomViews:
+
+    def test_dom_views_shared_across_snapshots_of_same_page(self):
+        first, second = _make_snapshot(), _make_snapshot()
+        assert dom_index(first) is dom_index(second)
+        assert html_lower(first) is html_lower(second)
+
+
+# ────────────────────── Crawler Helpers ──────────────────────
+
+@pytest.fixture(scope="module")
+def crawler():
+    """qa_agent.crawler, for its browser-free helpers (the module imports Playwright)."""
+    pytest.importorskip("playwright.async_api")
+    from qa_agent import crawler
+    return crawler
 
-    def test_meta_title_missing(self):
-        from qa_agent.checks.copywriter import _check_meta_page_title
-        snap = _make_snapshot(title="")
-        result = _check_meta_page_title(snap, _make_context())
-        assert result.status == CheckStatus.FAIL
 
-    def test_form_labels_present(self):
-        from qa_agent.checks.copywriter import _check_form_labels
-        result = _check_form_labels(_make_snapshot(), _make_context())
-        assert result.status == CheckStatus.PASS
+def _image_columns(*images: dict) -> dict[str, list]:
+    keys = ("src", "dataSrc", "alt", "width", "height", "naturalWidth", "naturalHeight")
+    return {k: [img[k] for img in images] for k in keys}
 
-    def test_full_copywriter_run(self):
-        from qa_agent.checks.copywriter import run
-        results = run(_make_snapshot(), _make_context())
-        assert len(results) == 9
+
+class TestCrawlerHelpers:
+
+    def test_image_rows_rebuilt_from_columns(self, crawler):
+        cols = _image_columns(
+            {"src": "https://cdn.example.com/hero.PNG?v=2", "dataSrc": "", "alt": "Hero",
+             "width": 800, "height": 400, "naturalWidth": 1600, "naturalHeight": 800},
+            {"src": "", "dataSrc": "/img/lazy.webp", "alt": "",
+             "width": 0, "height": 0, "naturalWidth": 0, "naturalHeight": 0},
+            {"src": "https://example.com/logo.png", "dataSrc": "", "alt": "Logo",
+             "width": 100, "height": 50, "naturalWidth": 100, "naturalHeight": 50},
+        )
+        hero, lazy, logo = crawler._image_rows(cols)
+        assert hero == {"src": "https://cdn.example.com/hero.PNG?v=2", "alt": "Hero",
+                        "width": 800, "height": 400, "naturalWidth": 1600, "naturalHeight": 800,
+                        "format": "png", "hasTransparency": False}
+        # Lazy images report their data-src but, as before, no format
+        assert lazy["src"] == "/img/lazy.webp" and lazy["format"] == ""
+        assert logo["format"] == "png" and logo["hasTransparency"] is True
+
+    def test_image_rows_empty_and_mismatched_columns(self, crawler):
+        assert crawler._image_rows(_image_columns()) == []
+        cols = _image_columns(
+            {"src": "a.jpg", "dataSrc": "", "alt": "A", "width": 1, "height": 1,
+             "naturalWidth": 1, "naturalHeight": 1},
+            {"src": "b.jpg", "dataSrc": "", "alt": "B", "width": 2, "height": 2,
+             "naturalWidth": 2, "naturalHeight": 2},
+        )
+        cols["alt"].pop()
+        rows = crawler._image_rows(cols)
+        assert [r["src"] for r in rows] == ["a.jpg"]
+
+    @pytest.mark.parametrize("host, blocked", [
+        ("googletagmanager.com", True),
+        ("www.googletagmanager.com", True),
+        ("a.b.connect.facebook.net", True),
+        ("bat.bing.com", True),
+        ("bing.com", False),
+        ("notgoogletagmanager.com", False),
+        ("googletagmanager.com.example.com", False),
+        ("", False),
+    ])
+    def test_blocked_hosts(self, crawler, host, blocked):
+        assert crawler._is_blocked_host(host) is blocked
 
 
 # ────────────────────── Full Pipeline ──────────────────────
 
+@pytest.fixture(scope="module")
+def full_results(snapshot, ctx):
+    """All 57 checks run once against the default snapshot; treat as read-only."""
+    return run_all(snapshot, ctx)
+
+
+@pytest.fixture(scope="module")
+def results_by_category(full_results):
+    """full_results split by category: each module's run() output, without re-running it."""
+    by_category = defaultdict(list)
+    for r in full_results:
+        by_category[r.category].append(r)
+    return by_category
+
+
+# Developer checks the default snapshot is allowed to fail
+_DEFAULT_DEV_FAILS = frozenset({"correct_group", "gtm_present", "footer_legal_links"})
+
+
+@pytest.fixture(scope="module")
+def full_report(full_results, ctx):
+    """A summarised report over full_results; treat as read-only."""
+    report = QAReport(context=ctx, results=full_results)
+    report.build_summary()
+    return report
+
+
+@pytest.mark.slow
 class TestFullPipeline:
 
-    def test_run_all(self):
-        from qa_agent.checks import run_all
-        results = run_all(_make_snapshot(), _make_context())
-        # 37 dev + 11 designer + 9 copywriter = 57
-        assert len(results) == 57
-
-    def test_report_summary(self):
-        from qa_agent.checks import run_all
-        from qa_agent.config import QAReport
-        results = run_all(_make_snapshot(), _make_context())
-        report = QAReport(context=_make_context(), results=results)
-        report.build_summary()
+    @pytest.mark.parametrize("category, expected", [
+        ("developer", 37),
+        ("designer", 11),
+        ("copywriter", 9),
+        (None, 57),  # 37 dev + 11 designer + 9 copywriter
+    ], ids=["developer", "designer", "copywriter", "all"])
+    def test_check_counts(self, full_results, results_by_category, category, expected):
+        results = full_results if category is None else results_by_category[category]
+        assert len(results) == expected
+
+    def test_default_developer_failures(self, results_by_category):
+        # With good defaults, we should get mostly PASS/WARN/SKIP, no unexpected errors
+        failed = {r.check_id for r in results_by_category["developer"] if r.status is FAIL}
+        assert failed <= _DEFAULT_DEV_FAILS
+
+    def test_report_summary(self, full_report):
+        report = full_report
         assert report.summary["total"] == 57
+        assert report.summary["pass_rate"] == f"{report.summary['pass_rate_pct']:.0f}%"
         assert "developer" in report.summary["by_category"]
         assert "designer" in report.summary["by_category"]
         assert "copywriter" in report.summary["by_category"]
 
-    def test_markdown_output(self, tmp_path):
-        from qa_agent.checks import run_all
-        from qa_agent.config import QAReport
-        from qa_agent.reporter import to_markdown
-        results = run_all(_make_snapshot(), _make_context())
-        report = QAReport(context=_make_context(), results=results)
-        path = to_markdown(report, str(tmp_path))
-        assert path.endswith(".md")
-        content = open(path).read()
+    def test_summary_built_once_per_results(self, full_results, ctx):
+        # A report of its own: this one has its results replaced
+        report = QAReport(context=ctx, results=full_results)
+        report.build_summary()
+        first = report.summary
+        report.build_summary()
+        assert report.summary is first
+        report.results = full_results[:10]
+        report.build_summary()
+        assert report.summary["total"] == 10
+        assert len(report.passed) == report.summary["passed"]
+        # Same length, different contents: still rebuilt
+        report.results = full_results
+        assert report.failed
+        report.results = [replace(r, status=PASS) for r in full_results]
+        report.build_summary()
+        assert report.summary["failed"] == 0 and not report.failed
+        # Results can only change through assignment
+        with pytest.raises(TypeError):
+            report.results[0] = full_results[0]
+
+    def test_shared_results_are_immutable(self, snapshot, ctx, full_results):
+        # Checks that don't look at the page return one prebuilt result every run
+        again = run_all(snapshot, ctx)
+        shared = [r for r, r2 in zip(full_results, again) if r is r2]
+        assert shared
+        with pytest.raises(FrozenInstanceError):
+            shared[0].status = FAIL
+
+    def test_status_lists_match_summary(self, full_report):
+        report = full_report
+        assert report.failed is report.failed  # grouped once, then reused
+        for key in ("passed", "failed", "warnings", "skipped"):
+            assert len(getattr(report, key)) == report.summary[key]
+
+    def test_markdown_output(self, full_report, tmp_path):
+        path = Path(to_markdown(full_report, str(tmp_path)))
+        assert path.suffix == ".md"
+        content = path.read_text(encoding="utf-8")
         assert "QA Report" in content
         assert "Passed" in content
+        # Date line and filename come from the same timestamp
+        stamp = datetime.strptime(path.stem.removeprefix("qa_report_"), "%Y%m%d_%H%M%S")
+        assert f"**Date:** {stamp.strftime('%Y-%m-%d %H:%M')}" in content
 
-    def test_asana_comment_format(self):
-        from qa_agent.checks import run_all
-        from qa_agent.config import QAReport
-        from qa_agent.reporter import to_asana_comment
-        results = run_all(_make_snapshot(), _make_context())
-        report = QAReport(context=_make_context(), results=results)
-        comment = to_asana_comment(report)
+    def test_asana_comment_format(self, full_report):
+        comment = to_asana_comment(full_report)
         assert "QA Agent Report" in comment
         assert "Pass rate" in comment